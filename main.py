@@ -5,6 +5,7 @@ from rehab_gamification.games.balloon_pop import BalloonPopGame
 from rehab_gamification.games.game_2 import FingerPainterGame
 from rehab_gamification.games.maze_game import MazeGame
 from rehab_gamification.games.dino_game import DinoGame
+from rehab_gamification.games.base_game import open_camera
 from rehab_gamification.data_manager import DataManager
 from rehab_gamification.calibration import CalibrationScreen
 import cv2
@@ -35,10 +36,12 @@ class MainApp:
 
         # Data Manager
         self.data_manager = DataManager(data_folder='rehab_gamification/data')
+        # Fold per-session files left by older versions into the sessions log
+        self.data_manager.migrate_legacy_sessions()
 
         # Centralized Hand Tracking and Camera
         self.hand_tracker = HandTracker()
-        self.cap = cv2.VideoCapture(0)
+        self.cap = open_camera(0)
 
         # Menu options
         self.menu_options = ["Balloon Pop", "Finger Painter", "Maze Game","Dino Game", "Dashboard", "Quit"]
@@ -135,20 +138,25 @@ class MainApp:
 
     def _show_dashboard(self):
         """Displays the dashboard with data from past sessions and allows per-game progress viewing."""
-        sessions = self.data_manager.load_all_sessions()
+        # Only the fields charted below are decoded, as one column per field
+        columns = self.data_manager.load_session_columns([
+            '/metadata/game_name',
+            '/metadata/session_start_time',
+            '/metrics/score',
+            '/metrics/min_pinch_distance',
+            '/metrics/max_pinch_distance',
+            '/metrics/max_speed'
+        ])
         self.screen.fill(self.white)
         self._draw_text('Dashboard', self.font, self.black, self.screen, self.screen.get_width() / 2, 50)
 
-        # --- Group sessions by game ---
-        game_sessions = {}
-        for session in sessions:
-            game_name = session.get('metadata', {}).get('game_name', 'Unknown')
-            if game_name not in game_sessions:
-                game_sessions[game_name] = []
-            game_sessions[game_name].append(session)
+        # --- Group session rows by game ---
+        game_rows = {}
+        for row, game_name in enumerate(columns['/metadata/game_name']):
+            game_rows.setdefault('Unknown' if game_name is None else game_name, []).append(row)
 
         # --- Game selection menu ---
-        games = list(game_sessions.keys())
+        games = list(game_rows.keys())
         button_rects = []
         y_pos = 120
         for game in games:
@@ -175,17 +183,22 @@ class MainApp:
             pygame.time.wait(10)
 
         # --- Show progress chart for selected game ---
-        self._show_game_progress_chart(game_sessions[selected_game], selected_game)
+        self._show_game_progress_chart(columns, game_rows[selected_game], selected_game)
 
-    def _show_game_progress_chart(self, sessions, game_name):
+    def _show_game_progress_chart(self, columns, rows, game_name):
         """Displays a progress chart for a specific game with hover tooltips."""
         # --- Prepare data ---
         from collections import defaultdict
         import datetime
 
-        date_sessions = defaultdict(list)
-        for session in sessions:
-            ts = session.get('metadata', {}).get('session_start_time', None)
+        def metric(name, row):
+            # Sessions without the metric count as 0
+            value = columns['/metrics/' + name][row]
+            return 0 if value is None else value
+
+        date_rows = defaultdict(list)
+        for row in rows:
+            ts = columns['/metadata/session_start_time'][row]
             if ts:
                 try:
                     date = datetime.datetime.fromisoformat(ts).date()
@@ -193,22 +206,22 @@ class MainApp:
                     date = "Unknown"
             else:
                 date = "Unknown"
-            date_sessions[date].append(session)
+            date_rows[date].append(row)
 
         # For each date, get max score, min/max pinch distance, max speed, etc.
         chart_data = []
-        for date in sorted(date_sessions.keys()):
-            day_sessions = date_sessions[date]
-            max_score = max([s.get('metrics', {}).get('score', 0) for s in day_sessions])
+        for date in sorted(date_rows.keys()):
+            day_rows = date_rows[date]
+            max_score = max([metric('score', r) for r in day_rows])
             
             # Get min and max pinch distances
-            all_min_pinch = [s.get('metrics', {}).get('min_pinch_distance', 0) for s in day_sessions]
-            all_max_pinch = [s.get('metrics', {}).get('max_pinch_distance', 0) for s in day_sessions]
+            all_min_pinch = [metric('min_pinch_distance', r) for r in day_rows]
+            all_max_pinch = [metric('max_pinch_distance', r) for r in day_rows]
             min_pinch_distance = min([d for d in all_min_pinch if d > 0]) if any(d > 0 for d in all_min_pinch) else 0
             max_pinch_distance = max(all_max_pinch) if all_max_pinch else 0
             
             # Get max speed
-            max_speed = max([s.get('metrics', {}).get('max_speed', 0) for s in day_sessions])
+            max_speed = max([metric('max_speed', r) for r in day_rows])
             
             chart_data.append({
                 "date": date,
@@ -216,7 +229,7 @@ class MainApp:
                 "min_pinch_distance": round(min_pinch_distance, 2),
                 "max_pinch_distance": round(max_pinch_distance, 2),
                 "max_speed": round(max_speed, 2),
-                "sessions": day_sessions
+                "rows": day_rows
             })
 
         # --- Draw chart ---
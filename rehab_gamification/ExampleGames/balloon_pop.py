@@ -1,6 +1,7 @@
 import pygame
 import random
 import cv2
+import numpy as np
 import sys
 import os
 
@@ -19,22 +20,7 @@ BLUE = (0, 0, 255)
 BLACK = (0, 0, 0)
 FONT_NAME = 'arial'
 FONT_SIZE = 30
-
-# --- Balloon Class ---
-class Balloon:
-    def __init__(self):
-        self.x = random.randint(0, SCREEN_WIDTH - BALLOON_SIZE)
-        self.y = 0
-        self.speed = random.randint(1, 3)
-        self.rect = pygame.Rect(self.x, self.y, BALLOON_SIZE, BALLOON_SIZE)
-        self.color = (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
-
-    def move(self):
-        self.y += self.speed
-        self.rect.top = self.y
-
-    def draw(self, screen):
-        pygame.draw.ellipse(screen, self.color, self.rect)
+DETECTION_WIDTH = 320  # Wider frames are downscaled to this width before hand detection
 
 # --- Main Game Loop ---
 def main():
@@ -53,7 +39,11 @@ def main():
         print("Warning: 'pop.wav' not found in 'assets' directory. Sound will not play.")
         pop_sound = None
 
-    balloons = []
+    # Balloons as parallel arrays: top-left corner, fall speed and color
+    xs = np.empty(0, np.int32)
+    ys = np.empty(0, np.int32)
+    speeds = np.empty(0, np.int32)
+    colors = np.empty((0, 3), np.uint8)
     score = 0
     
     cap = cv2.VideoCapture(0)
@@ -72,28 +62,43 @@ def main():
                 continue
             
             frame = cv2.flip(frame, 1)
-            landmarks = hand_tracking.detect_hands(frame)
+            # Landmarks are normalized, so frame.shape still maps them onto the full-size frame
+            frame_h, frame_w = frame.shape[:2]
+            if frame_w > DETECTION_WIDTH:
+                small = cv2.resize(frame, (DETECTION_WIDTH, frame_h * DETECTION_WIDTH // frame_w), interpolation=cv2.INTER_AREA)
+            else:
+                small = frame
+            landmarks = hand_tracking.detect_hands(small)
             is_pinching, pinch_pos = hand_tracking.get_pinch_gesture(landmarks, frame.shape)
             hand_pos = hand_tracking.get_hand_position(landmarks, frame.shape)
 
             # --- Game Logic ---
             if random.randint(1, 20) == 1:  # Create new balloons randomly
-                balloons.append(Balloon())
-
-            for balloon in balloons[:]:
-                balloon.move()
-                if balloon.y > SCREEN_HEIGHT:
-                    balloons.remove(balloon)
-                
-                if is_pinching and pinch_pos:
-                    pinch_rect = pygame.Rect(pinch_pos[0] - HAND_CURSOR_SIZE // 2, 
-                                             pinch_pos[1] - HAND_CURSOR_SIZE // 2, 
-                                             HAND_CURSOR_SIZE, HAND_CURSOR_SIZE)
-                    if balloon.rect.colliderect(pinch_rect):
-                        balloons.remove(balloon)
-                        score += 1
-                        if pop_sound:
-                            pop_sound.play()
+                xs = np.append(xs, random.randint(0, SCREEN_WIDTH - BALLOON_SIZE))
+                ys = np.append(ys, 0)
+                speeds = np.append(speeds, random.randint(1, 3))
+                colors = np.concatenate((colors, [(random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))]))
+
+            # Move every balloon and keep the ones still on screen
+            ys += speeds
+            keep = ys <= SCREEN_HEIGHT
+
+            if is_pinching and pinch_pos:
+                # Same overlap test as pygame.Rect.colliderect against the pinch square
+                px1 = pinch_pos[0] - HAND_CURSOR_SIZE // 2
+                py1 = pinch_pos[1] - HAND_CURSOR_SIZE // 2
+                px2 = px1 + HAND_CURSOR_SIZE
+                py2 = py1 + HAND_CURSOR_SIZE
+                hit = keep & (xs < px2) & (xs + BALLOON_SIZE > px1) & (ys < py2) & (ys + BALLOON_SIZE > py1)
+                popped = int(hit.sum())
+                if popped:
+                    score += popped
+                    keep &= ~hit
+                    if pop_sound:
+                        pop_sound.play()
+
+            if not keep.all():
+                xs, ys, speeds, colors = xs[keep], ys[keep], speeds[keep], colors[keep]
             
             if score > 10:
                 game_over = True
@@ -101,8 +106,8 @@ def main():
             # --- Drawing ---
             screen.fill(WHITE)
 
-            for balloon in balloons:
-                balloon.draw(screen)
+            for x, y, color in zip(xs.tolist(), ys.tolist(), colors.tolist()):
+                pygame.draw.ellipse(screen, color, (x, y, BALLOON_SIZE, BALLOON_SIZE))
 
             if hand_pos:
                 # If pinching, move cursor to pinch position for accurate feedback
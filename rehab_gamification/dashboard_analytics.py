@@ -40,6 +40,26 @@ class DashboardAnalytics:
                         self.session_data.append(data)
                 except Exception as e:
                     print(f"Error loading {filename}: {e}")
+        
+        # Sessions saved by DataManager are appended to a single log file
+        log_path = os.path.join(self.data_directory, 'sessions.jsonl')
+        if os.path.exists(log_path):
+            with open(log_path, 'r') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        print(f"Error loading sessions.jsonl line {line_no}: {e}")
+                        continue
+                    metadata = data.get('metadata', {})
+                    try:
+                        stamp = datetime.fromisoformat(metadata.get('session_start_time', '')).strftime("%Y%m%d_%H%M%S")
+                    except ValueError:
+                        stamp = "unknown"
+                    data['filename'] = f"session_{metadata.get('game_name', 'Unknown')}_{stamp}.json"
+                    self.session_data.append(data)
     
     def get_overall_performance_summary(self) -> Dict[str, Any]:
         """
@@ -7,8 +7,21 @@ Generates the dashboard HTML with embedded data and opens it in browser
 import os
 import json
 import webbrowser
+from datetime import datetime
 from pathlib import Path
 
+# Values shown on the KPI cards when kpi_data.json is missing a field
+_KPI_DEFAULTS = {
+    'avg_accuracy': 0.0,
+    'total_sessions': 0,
+    'consecutive_days': 0,
+    'improvement': 0.0
+}
+
+def _lis(items):
+    """Render items as <li> elements with a single join"""
+    return '<li>' + '</li><li>'.join(map(str, items)) + '</li>' if items else ''
+
 class DashboardLauncher:
     def __init__(self):
         self.progress_dir = Path("Progress")
@@ -68,7 +81,7 @@ class DashboardLauncher:
         """Generate complete HTML dashboard with embedded data"""
         
         # Extract data safely with defaults
-        kpi = data.get('kpi', {})
+        kpi = {**_KPI_DEFAULTS, **data.get('kpi', {})}
         charts = data.get('chart', {})
         physical = data.get('physical_metrics', {})
         engagement = data.get('engagement', {})
@@ -354,10 +367,10 @@ class DashboardLauncher:
         <div class="chart-section">
             <h2 class="chart-title"><i class="fas fa-chart-line"></i> Performance Summary</h2>
             <div class="data-display">
-                <strong>Total Sessions:</strong> {kpi.get('total_sessions', 0)}<br>
-                <strong>Average Accuracy:</strong> {kpi.get('avg_accuracy', 0):.1f}%<br>
-                <strong>Consecutive Days:</strong> {kpi.get('consecutive_days', 0)}<br>
-                <strong>Improvement Trend:</strong> {kpi.get('improvement', 0):+.1f}%
+                <strong>Total Sessions:</strong> {kpi['total_sessions']}<br>
+                <strong>Average Accuracy:</strong> {kpi['avg_accuracy']:.1f}%<br>
+                <strong>Consecutive Days:</strong> {kpi['consecutive_days']}<br>
+                <strong>Improvement Trend:</strong> {kpi['improvement']:+.1f}%
             </div>
         </div>
         
@@ -497,10 +510,11 @@ class DashboardLauncher:
     
     def generate_kpi_cards(self, kpi):
         """Generate KPI cards HTML"""
-        avg_accuracy = kpi.get('avg_accuracy', 0)
-        total_sessions = kpi.get('total_sessions', 0)
-        consecutive_days = kpi.get('consecutive_days', 0)
-        improvement = kpi.get('improvement', 0)
+        kpi = {**_KPI_DEFAULTS, **kpi}
+        avg_accuracy = kpi['avg_accuracy']
+        total_sessions = kpi['total_sessions']
+        consecutive_days = kpi['consecutive_days']
+        improvement = kpi['improvement']
         
         return f'''
             <div class="kpi-card">
@@ -623,13 +637,15 @@ class DashboardLauncher:
         # Performance Summary
         performance = insights.get('performance_summary', {})
         if performance:
+            overall_accuracy = performance.get('overall_accuracy', 0)
+            improvement_trend = performance.get('improvement_trend', 0)
             content.append(f'''
                 <div class="insight-item">
                     <div class="insight-title"><i class="fas fa-chart-bar"></i> Performance Summary</div>
                     <div class="insight-content">
-                        Your overall accuracy is {performance.get('overall_accuracy', 0):.1f}% with a 
-                        {'positive' if performance.get('improvement_trend', 0) > 0 else 'stable'} improvement trend of 
-                        {performance.get('improvement_trend', 0):.1f}%. 
+                        Your overall accuracy is {overall_accuracy:.1f}% with a 
+                        {'positive' if improvement_trend > 0 else 'stable'} improvement trend of 
+                        {improvement_trend:.1f}%. 
                         Your engagement level is {performance.get('engagement_level', 'moderate')}.
                     </div>
                 </div>
@@ -638,7 +654,7 @@ class DashboardLauncher:
         # Strengths
         strengths = insights.get('strengths', [])
         if strengths:
-            strength_list = ''.join([f'<li>{strength}</li>' for strength in strengths])
+            strength_list = _lis(strengths)
             content.append(f'''
                 <div class="insight-item">
                     <div class="insight-title"><i class="fas fa-star"></i> Your Strengths</div>
@@ -651,7 +667,7 @@ class DashboardLauncher:
         # Recommendations
         recommendations = insights.get('recommendations', [])
         if recommendations:
-            rec_list = ''.join([f'<li>{rec}</li>' for rec in recommendations])
+            rec_list = _lis(recommendations)
             content.append(f'''
                 <div class="insight-item">
                     <div class="insight-title"><i class="fas fa-lightbulb"></i> Recommendations</div>
@@ -664,7 +680,7 @@ class DashboardLauncher:
         # Next Milestones
         milestones = insights.get('next_milestones', [])
         if milestones:
-            milestone_list = ''.join([f'<li>{milestone}</li>' for milestone in milestones])
+            milestone_list = _lis(milestones)
             content.append(f'''
                 <div class="insight-item">
                     <div class="insight-title"><i class="fas fa-target"></i> Next Goals</div>
@@ -689,8 +705,7 @@ class DashboardLauncher:
     
     def get_current_time(self):
         """Get current time string"""
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return datetime.now().isoformat(sep=' ', timespec='seconds')
 
 if __name__ == "__main__":
     launcher = DashboardLauncher()
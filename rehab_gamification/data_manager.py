@@ -1,10 +1,104 @@
 import json
+import mmap
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib encoder is used instead
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # simdjson is optional, field projection falls back to a full decode
+    simdjson = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional, needed only for compressed session files
+    zstandard = None
+
+# Every saved session is appended as one line to this file.
+SESSIONS_LOG = 'sessions.jsonl'
+
+# Log reads at least this large are decoded from a memory map instead of a bytes copy
+_MMAP_THRESHOLD = 256 * 1024
+
+# Game names of session files whose name doesn't contain it, one {"filename", "game_name"} object per line
+SESSION_INDEX = 'index.jsonl'
+
+# Per-session files are plain JSON, or zstd-compressed JSON when written with compress=True
+_SESSION_SUFFIXES = ('.json', '.json.zst')
+
+# Canonical per-session file name: session_<game>_<YYYYmmdd>_<HHMMSS>.json[.zst]
+_SESSION_FILE_RE = re.compile(r'session_(.+)_(\d{8}_\d{6})\.json(?:\.zst)?$')
+
+
+def _dumps(obj, pretty=False):
+    """Encodes an object as compact JSON bytes, or indented by two spaces if pretty is set."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(buf):
+    """Decodes JSON from bytes, a memoryview or str."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    if isinstance(buf, memoryview):
+        buf = buf.tobytes()
+    return json.loads(buf)
+
+
+def _atomic_write(path, payload):
+    """Writes bytes to a temporary file next to path and renames it over path, so readers never see a partial file."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def _resolve_pointer(data, pointer):
+    """Looks up a JSON pointer such as '/metadata/game_name' in decoded data, raising KeyError if absent."""
+    for key in pointer.strip('/').split('/'):
+        if not isinstance(data, dict):
+            raise KeyError(pointer)
+        data = data[key]
+    return data
+
+
+def _set_pointer(target, pointer, value):
+    """Stores a value at a JSON pointer, creating the intermediate dicts."""
+    *parents, leaf = pointer.strip('/').split('/')
+    for key in parents:
+        target = target.setdefault(key, {})
+    target[leaf] = value
+
+
+def _file_stamp(iso):
+    """Turns an isoformat timestamp into the YYYYmmdd_HHMMSS file name stamp, or None if it isn't one."""
+    stamp = iso[:19].replace('-', '').replace(':', '').replace('T', '_')
+    return stamp if len(stamp) == 15 and stamp[8] == '_' and stamp.replace('_', '').isdigit() else None
+
+
+# Errors that skip a single unreadable session file, including corrupt zstd frames
+_SESSION_FILE_ERRORS = (ValueError, KeyError, RuntimeError) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+# Read from legacy files too when projecting, so their metadata can be rebuilt
+_LEGACY_METADATA_FIELDS = ('/metadata', '/session_metadata', '/game_name')
+
+
 class DataManager:
     """
     Manages saving and loading of game session data.
+
+    New sessions are appended to a single newline-delimited JSON log
+    (``sessions.jsonl``). Per-session ``session_*.json`` files written by
+    older versions (and by the dummy data generator) are still read.
     """
     def __init__(self, data_folder='data'):
         """
@@ -12,95 +106,484 @@ class DataManager:
         :param data_folder: The folder where session data is stored.
         """
         self.data_folder = data_folder
-        if not os.path.exists(self.data_folder):
-            os.makedirs(self.data_folder)
+        self.log_path = os.path.join(self.data_folder, SESSIONS_LOG)
+        # One parser is reused for every document so its buffers are only allocated once
+        self._parser = simdjson.Parser() if simdjson is not None else None
+        self._zstd_compressor = zstandard.ZstdCompressor(level=3) if zstandard is not None else None
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard is not None else None
+        # Parsed sessions are kept between calls since saved sessions never change:
+        # the log is only read past the offset already parsed, and legacy files
+        # are re-parsed only when their mtime changes.
+        self._log_cache = {}
+        self._cache = {}
+        os.makedirs(self.data_folder, exist_ok=True)
+        self.index_path = os.path.join(self.data_folder, SESSION_INDEX)
+        self._index = self._read_index()
 
     def save_session(self, game_name, session_data):
         """
-        Saves a game session's data to a JSON file with a more detailed structure.
+        Appends a game session's data to the sessions log with a more detailed structure.
+        :param game_name: The name of the game.
+        :param session_data: A dictionary containing the session's data.
+        """
+        # One append per session instead of creating a new file each time
+        with open(self.log_path, 'ab') as f:
+            f.write(_dumps(self._session_record(game_name, session_data)) + b'\n')
+        print(f"Session saved to {self.log_path}")
+
+    @staticmethod
+    def _session_record(game_name, session_data):
+        """
+        Wraps a game session's data with its metadata.
         :param game_name: The name of the game.
         :param session_data: A dictionary containing the session's data.
+        :return: The record as stored in the sessions log.
         """
-        timestamp = datetime.now()
-        filename = os.path.join(self.data_folder, f"session_{game_name}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json")
-        
+        # Formatted once; export file names are derived from this string
+        start_time = datetime.now().isoformat(timespec='seconds')
+
         # Enhance the data structure
-        data_to_save = {
+        return {
             "metadata": {
                 "game_name": game_name,
-                "session_start_time": timestamp.isoformat(),
+                "session_start_time": start_time,
                 "version": "1.0"
             },
             "metrics": session_data
         }
-        
-        with open(filename, 'w') as f:
-            json.dump(data_to_save, f, indent=4)
-        print(f"Session saved to {filename}")
 
-    def load_all_sessions(self):
+    def load_all_sessions(self, fields=None):
         """
         Loads all session data from the data folder.
-        :return: A list of all session data dictionaries.
+        :param fields: Optional JSON pointers to object keys (e.g. '/metadata/game_name'). When given,
+                       each session only contains those fields, which skips building the full tree.
+        :return: A list of all session data dictionaries, newest logged sessions first. The dictionaries
+                 are cached and shared between calls, so treat them as read-only.
+        """
+        return self._load_log(fields) + self._load_session_files(fields)
+
+    def load_session_columns(self, fields):
+        """
+        Loads the given fields of every session as columns instead of one dictionary per session.
+        :param fields: JSON pointers to object keys, e.g. ['/metadata/game_name', '/metrics/score'].
+        :return: A dictionary mapping each pointer to a list with one value per session
+                 (None where a session lacks the field), in load_all_sessions order.
+        """
+        fields = list(fields)
+        columns = {pointer: [] for pointer in fields}
+        for session in self.load_all_sessions(fields):
+            for pointer in fields:
+                try:
+                    value = _resolve_pointer(session, pointer)
+                except KeyError:
+                    value = None
+                columns[pointer].append(value)
+        return columns
+
+    def _decode(self, buf, fields=None):
+        """
+        Decodes one JSON document, optionally keeping only the given fields.
+        :param buf: The raw JSON bytes.
+        :param fields: JSON pointers to extract, or None for the whole document.
+        :return: The decoded dictionary.
+        """
+        if fields is None:
+            return _loads(buf)
+
+        projected = {}
+        if self._parser is not None:
+            doc = self._parser.parse(bytes(buf) if isinstance(buf, memoryview) else buf)
+            for pointer in fields:
+                try:
+                    value = doc.at_pointer(pointer)
+                except (KeyError, IndexError, ValueError):
+                    continue
+                if isinstance(value, simdjson.Object):
+                    value = value.as_dict()
+                elif isinstance(value, simdjson.Array):
+                    value = value.as_list()
+                _set_pointer(projected, pointer, value)
+            # The parser reuses its buffer for the next document, so drop the proxy now
+            del doc
+        else:
+            data = _loads(buf)
+            for pointer in fields:
+                try:
+                    _set_pointer(projected, pointer, _resolve_pointer(data, pointer))
+                except KeyError:
+                    continue
+        return projected
+
+    def _load_log(self, fields=None):
+        """
+        Reads the sessions log, parsing only lines appended since the previous call.
+        :param fields: Optional JSON pointers to extract from each session.
+        :return: The logged sessions, newest first.
+        """
+        key = tuple(fields) if fields is not None else None
+        try:
+            size = os.path.getsize(self.log_path)
+        except OSError:
+            self._log_cache.pop(key, None)
+            return []
+
+        offset, line_count, sessions = self._log_cache.get(key, (0, 0, []))
+        if size < offset:
+            # The log was rewritten elsewhere, start over
+            offset, line_count, sessions = 0, 0, []
+
+        if size > offset:
+            sessions = list(sessions)
+            with open(self.log_path, 'rb') as f:
+                if size - offset >= _MMAP_THRESHOLD:
+                    # Lines are decoded straight from the mapped pages, without first
+                    # copying the whole unread part of the log into a bytes object
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        end, line_count = self._parse_log_lines(mm, offset, line_count, fields, sessions)
+                else:
+                    f.seek(offset)
+                    end, line_count = self._parse_log_lines(f.read(), 0, line_count, fields, sessions)
+                    end += offset
+            offset = end
+
+        self._log_cache[key] = (offset, line_count, sessions)
+        return sessions[::-1]
+
+    def _parse_log_lines(self, buf, start, line_count, fields, sessions):
         """
+        Decodes the complete lines of buf from start on, appending them to sessions.
+        An unterminated last line is left for the next call, as it may still be being written.
+        :param buf: The log contents, as bytes or an mmap.
+        :param start: The position in buf to start at.
+        :param line_count: The number of log lines before start, for warnings.
+        :param fields: Optional JSON pointers to extract from each session.
+        :param sessions: The list to append decoded sessions to.
+        :return: The position after the last complete line and the updated line count.
+        """
+        view = memoryview(buf)
+        try:
+            pos = start
+            while True:
+                newline = buf.find(b'\n', pos)
+                if newline == -1:
+                    break
+                line_count += 1
+                line = view[pos:newline]
+                pos = newline + 1
+                try:
+                    sessions.append(self._decode(line, fields))
+                except ValueError as e:
+                    # Blank lines are skipped silently, a torn line is left behind if the app dies mid-append
+                    if line.tobytes().strip():
+                        print(f"Warning: Could not decode line {line_count} of {SESSIONS_LOG}. Error: {e}")
+                finally:
+                    line.release()
+        finally:
+            view.release()
+        return pos, line_count
+
+    def _load_session_files(self, fields=None):
+        """
+        Loads the legacy one-file-per-session JSON files.
+        :param fields: Optional JSON pointers to extract from each session.
+        :return: A list of session data dictionaries.
+        """
+        if fields is not None:
+            fields = list(fields) + [p for p in _LEGACY_METADATA_FIELDS if p not in fields]
+
+        key = tuple(fields) if fields is not None else None
         all_sessions = []
-        for filename in sorted(os.listdir(self.data_folder), reverse=True):
-            if filename.endswith(".json"):
-                filepath = os.path.join(self.data_folder, filename)
-                with open(filepath, 'r') as f:
-                    try:
-                        data = json.load(f)
-                        
-                        # Handle both old and new data structures
-                        if 'metadata' in data:
-                            # Old format
-                            data['metadata']['filename'] = filename
-                        elif 'session_metadata' in data:
-                            # New enhanced format - create backward compatibility
-                            if 'metadata' not in data:
-                                data['metadata'] = {
-                                    'game_name': data['session_metadata'].get('game_name', 'Unknown'),
-                                    'session_start_time': data['session_metadata'].get('start_time', ''),
-                                    'filename': filename
-                                }
-                        else:
-                            # Fallback for very old formats
-                            data['metadata'] = {
-                                'game_name': 'Unknown',
-                                'session_start_time': '',
-                                'filename': filename
-                            }
-                        
-                        all_sessions.append(data)
-                    except (json.JSONDecodeError, KeyError) as e:
-                        print(f"Warning: Could not decode or parse JSON from {filename}. Error: {e}")
+        # DirEntry objects come back with the joined path and cached file
+        # type from the single directory read, so no per-file join/stat.
+        with os.scandir(self.data_folder) as it:
+            entries = [e for e in it if e.name.endswith(_SESSION_SUFFIXES) and e.is_file(follow_symlinks=False)]
+        entries.sort(key=lambda e: e.name, reverse=True)
+
+        # Forget files that have been deleted since the last call
+        names = {e.name for e in entries}
+        for filename in [f for f in self._cache if f not in names]:
+            del self._cache[filename]
+
+        mtimes = {e.name: e.stat().st_mtime_ns for e in entries}
+        stale = [e for e in entries if self._cache.get(e.name, (None, None))[:2] != (mtimes[e.name], key)]
+
+        # Files are read concurrently since the reads release the GIL. Projections and
+        # .zst files are finished here, as the parser and decompressor aren't thread-safe.
+        prefetched = {}
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2, len(stale))) as executor:
+                results = executor.map(lambda e: self._prefetch_session_file(e, fields is None), stale)
+                prefetched = dict(zip((e.name for e in stale), results))
+
+        for entry in entries:
+            filename = entry.name
+            mtime = mtimes[filename]
+            if filename not in prefetched:
+                all_sessions.append(self._cache[filename][2])
+                continue
+
+            decoded, result = prefetched[filename]
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                data = result if decoded else self._decode(self._read_session_bytes(filename, result), fields)
+
+                # Handle both old and new data structures
+                known_game = True
+                if 'metadata' in data:
+                    # Old format
+                    data['metadata']['filename'] = filename
+                elif 'session_metadata' in data:
+                    # New enhanced format - create backward compatibility
+                    if 'metadata' not in data:
+                        data['metadata'] = {
+                            'game_name': data['session_metadata'].get('game_name', data.get('game_name', 'Unknown')),
+                            'session_start_time': data['session_metadata'].get('start_time', ''),
+                            'filename': filename
+                        }
+                else:
+                    # Fallback for very old formats; the name is a guess, so don't index it
+                    known_game = False
+                    data['metadata'] = {
+                        'game_name': 'Unknown',
+                        'session_start_time': '',
+                        'filename': filename
+                    }
+
+                if known_game and not _SESSION_FILE_RE.match(filename) and filename not in self._index:
+                    self._add_to_index(filename, data['metadata'].get('game_name'))
+                self._cache[filename] = (mtime, key, data)
+                all_sessions.append(data)
+            except _SESSION_FILE_ERRORS as e:
+                print(f"Warning: Could not decode or parse JSON from {filename}. Error: {e}")
         return all_sessions
 
+    def _prefetch_session_file(self, entry, decode):
+        """
+        Reads a session file, decoding it right away when possible. Runs in worker threads.
+        :param entry: The DirEntry of the file.
+        :param decode: Whether plain JSON files should be decoded here.
+        :return: A (decoded, data) tuple, where data is the decoded session, the raw bytes, or the decode error.
+        """
+        with open(entry.path, 'rb') as f:
+            buf = f.read()
+        if not decode or entry.name.endswith('.zst'):
+            return False, buf
+        try:
+            return True, _loads(buf)
+        except ValueError as e:
+            return True, e
+
+    def _read_session_bytes(self, filename, buf):
+        """
+        Returns the JSON bytes of a session file, decompressing .zst files.
+        :param filename: The name of the file the bytes were read from.
+        :param buf: The raw file contents.
+        :return: The JSON bytes.
+        """
+        if not filename.endswith('.zst'):
+            return buf
+        if self._zstd_decompressor is None:
+            raise RuntimeError("zstandard is not installed")
+        return self._zstd_decompressor.decompress(buf)
+
+    def export_session_files(self, export_folder=None, compress=False, pretty=False):
+        """
+        Writes every logged session out as its own session_<game>_<timestamp>.json file,
+        e.g. for backups or for tools that expect one file per session.
+        :param export_folder: Destination folder, defaults to <data_folder>/export.
+        :param compress: Write zstd-compressed .json.zst files.
+        :param pretty: Indent the JSON for human inspection instead of writing it compact.
+        :return: The list of written file paths.
+        """
+        export_folder = export_folder or os.path.join(self.data_folder, 'export')
+        os.makedirs(export_folder, exist_ok=True)
+        if compress and self._zstd_compressor is None:
+            print("Warning: zstandard is not installed, exporting uncompressed JSON instead.")
+            compress = False
+
+        written = []
+        for session in self._load_log():
+            metadata = session.get('metadata', {})
+            stamp = _file_stamp(metadata.get('session_start_time', ''))
+            if stamp is None:
+                print(f"Warning: Skipping logged session without a valid start time: {metadata}")
+                continue
+            filename = os.path.join(export_folder, f"session_{metadata.get('game_name', 'Unknown')}_{stamp}.json")
+            payload = _dumps(session, pretty)
+            if compress:
+                filename += '.zst'
+                payload = self._zstd_compressor.compress(payload)
+            _atomic_write(filename, payload)
+            written.append(filename)
+        return written
+
+    def migrate_legacy_sessions(self):
+        """
+        Moves the one-file-per-session JSON files into the sessions log and deletes them.
+        Migrated sessions are placed ahead of the already logged ones, oldest first.
+        :return: The number of migrated sessions.
+        """
+        legacy = self._load_session_files()
+        if not legacy:
+            return 0
+
+        for session in legacy:
+            metadata = session['metadata']
+            if not metadata.get('session_start_time'):
+                # Files without a recorded start time carry it in their name
+                match = _SESSION_FILE_RE.match(metadata['filename'])
+                if match:
+                    metadata['session_start_time'] = datetime.strptime(match.group(2), '%Y%m%d_%H%M%S').isoformat()
+        legacy.sort(key=lambda session: session['metadata'].get('session_start_time', ''))
+
+        try:
+            with open(self.log_path, 'rb') as f:
+                existing = f.read()
+        except FileNotFoundError:
+            existing = b''
+        if existing and not existing.endswith(b'\n'):
+            existing += b'\n'
+
+        # The merged log is swapped in whole, so a crash never loses sessions
+        _atomic_write(self.log_path, b''.join(_dumps(session) + b'\n' for session in legacy) + existing)
+
+        for session in legacy:
+            os.remove(os.path.join(self.data_folder, session['metadata']['filename']))
+        self._log_cache.clear()
+        self._cache.clear()
+        self._index.clear()
+        self._write_index()
+        print(f"Migrated {len(legacy)} session files into {self.log_path}")
+        return len(legacy)
+
     def clear_game_data(self, game_name):
         """
         Clears all session data for a specific game.
         :param game_name: The name of the game whose data should be cleared.
         """
-        if not os.path.exists(self.data_folder):
+        try:
+            with os.scandir(self.data_folder) as it:
+                entries = [e for e in it if e.name.endswith(_SESSION_SUFFIXES) and e.is_file(follow_symlinks=False)]
+        except FileNotFoundError:
             return
-        
-        files = [f for f in os.listdir(self.data_folder) if f.endswith('.json')]
-        for filename in files:
-            filepath = os.path.join(self.data_folder, filename)
+
+        self._clear_log(game_name)
+
+        for entry in entries:
+            filename = entry.name
             try:
-                with open(filepath, 'r') as f:
-                    session = json.load(f)
-                
-                # Handle both old and new data structures
-                game_name_in_session = None
-                if 'metadata' in session:
-                    game_name_in_session = session['metadata'].get('game_name')
-                elif 'session_metadata' in session:
-                    game_name_in_session = session['session_metadata'].get('game_name')
-                
+                # The game name is part of the canonical file name, and the index
+                # holds it for the other files, so files are only opened as a last resort
+                match = _SESSION_FILE_RE.match(filename)
+                if match:
+                    game_name_in_session = match.group(1)
+                elif filename in self._index:
+                    game_name_in_session = self._index[filename]
+                else:
+                    with open(entry.path, 'rb') as f:
+                        session = _loads(self._read_session_bytes(filename, f.read()))
+
+                    # Handle both old and new data structures
+                    game_name_in_session = None
+                    if 'metadata' in session:
+                        game_name_in_session = session['metadata'].get('game_name')
+                    elif 'session_metadata' in session:
+                        game_name_in_session = session['session_metadata'].get('game_name')
+
                 if game_name_in_session == game_name:
-                    os.remove(filepath)
+                    os.remove(entry.path)
             except Exception as e:
                 print(f"Error clearing {filename}: {e}")
 
+        # Drop index entries for the removed files and any deleted elsewhere
+        remaining = set(os.listdir(self.data_folder))
+        index = {k: v for k, v in self._index.items() if k in remaining}
+        if len(index) != len(self._index):
+            self._index = index
+            self._write_index()
+
+    def _read_index(self):
+        """
+        Loads the file name to game name index.
+        :return: A dictionary mapping file names to game names.
+        """
+        index = {}
+        try:
+            with open(self.index_path, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return index
+        for line in lines:
+            try:
+                entry = _loads(line)
+                index[entry['filename']] = entry['game_name']
+            except (ValueError, KeyError, TypeError):
+                continue  # a torn line only costs a re-parse of that file
+        return index
+
+    def _add_to_index(self, filename, game_name):
+        """
+        Records a session file's game name, appending it to the index file.
+        :param filename: The session file name.
+        :param game_name: The game the session belongs to.
+        """
+        self._index[filename] = game_name
+        with open(self.index_path, 'ab') as f:
+            f.write(_dumps({'filename': filename, 'game_name': game_name}) + b'\n')
+
+    def _write_index(self):
+        """
+        Rewrites the index file from the in-memory index, dropping stale lines.
+        """
+        if not self._index:
+            try:
+                os.remove(self.index_path)
+            except FileNotFoundError:
+                pass
+            return
+        _atomic_write(self.index_path, b''.join(_dumps({'filename': k, 'game_name': v}) + b'\n' for k, v in self._index.items()))
+
+    def _clear_log(self, game_name):
+        """
+        Rewrites the sessions log without the given game's sessions.
+        :param game_name: The name of the game whose sessions should be dropped.
+        """
+        try:
+            with open(self.log_path, 'rb') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        kept = []
+        removed = False
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                session = self._decode(line, ['/metadata/game_name'])
+            except ValueError:
+                continue  # drop torn lines while we are rewriting anyway
+            if session.get('metadata', {}).get('game_name') != game_name:
+                kept.append(line + b'\n')
+            else:
+                removed = True
+
+        # Blank and torn lines alone don't warrant a rewrite
+        if removed:
+            _atomic_write(self.log_path, b''.join(kept))
+            self._log_cache.clear()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Exports the logged sessions as one JSON file per session.")
+    parser.add_argument('--data-folder', default='rehab_gamification/data', help="Folder holding sessions.jsonl.")
+    parser.add_argument('--export-folder', help="Destination folder, defaults to <data-folder>/export.")
+    parser.add_argument('--compress', action='store_true', help="Write zstd-compressed .json.zst files.")
+    parser.add_argument('--pretty', action='store_true', help="Indent the JSON for human inspection.")
+    args = parser.parse_args()
 
+    written = DataManager(args.data_folder).export_session_files(args.export_folder, compress=args.compress, pretty=args.pretty)
+    print(f"Exported {len(written)} sessions")
@@ -2,10 +2,41 @@
 
 import json
 import os
-import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib encoder is used instead
+    orjson = None
+
+# Minutes between two sessions played on the same day
+SESSION_SPACING_MINUTES = 45
+
+
+def _encode_session(session_data: dict, pretty: bool = False) -> bytes:
+    """Encode a session as compact JSON bytes, or indented when pretty is set"""
+    if orjson is not None:
+        return orjson.dumps(session_data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(session_data, indent=2).encode('utf-8')
+    return json.dumps(session_data, separators=(',', ':')).encode('utf-8')
+
+
+def _session_stamp(timestamp: datetime) -> str:
+    """Format a timestamp as YYYYmmdd_HHMMSS by slicing its isoformat string"""
+    iso = timestamp.isoformat(timespec='seconds')
+    return f"{iso[0:4]}{iso[5:7]}{iso[8:10]}_{iso[11:13]}{iso[14:16]}{iso[17:19]}"
+
+
+def _write_file(path: str, payload: bytes):
+    """Write to a temporary file and rename it into place, so readers never see a partial session"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
 class DummyDataGenerator:
     """
     Generate realistic dummy data for rehabilitation gaming dashboard testing.
@@ -17,9 +48,21 @@ class DummyDataGenerator:
     - Enhanced analytics data structure
     """
     
-    def __init__(self, data_directory: str = "rehab_gamification/data"):
+    def __init__(self, data_directory: str = "rehab_gamification/data", pretty: bool = False, seed: int = None):
         self.data_directory = data_directory
+        self.pretty = pretty  # indent the written JSON for human inspection
         self.games = ['BalloonPop', 'MazeGame', 'FingerPainter', 'DinoGame', 'AngleMaster']
+        # Every random draw goes through this one generator; pass a seed for a reproducible dataset
+        self.rng = np.random.default_rng(seed)
+        
+        # Game-specific metric generators, each producing the metrics for a batch of sessions
+        self._game_generators = {
+            'BalloonPop': self._generate_balloon_pop_metrics,
+            'MazeGame': self._generate_maze_metrics,
+            'FingerPainter': self._generate_finger_painter_metrics,
+            'DinoGame': self._generate_dino_metrics,
+            'AngleMaster': self._generate_angle_master_metrics
+        }
         
         # Ensure data directory exists
         os.makedirs(self.data_directory, exist_ok=True)
@@ -41,180 +84,256 @@ class DummyDataGenerator:
         base_smoothness = 45  # Starting movement smoothness
         base_detection_rate = 88  # Starting hand detection rate
         
-        for day in range(num_days):
-            current_date = base_date + timedelta(days=day)
-            
-            # Skip some days randomly to simulate real usage
-            if random.random() < 0.15:  # 15% chance to skip a day
-                continue
-            
-            # Variable sessions per day
-            num_sessions = max(1, int(np.random.normal(sessions_per_day, 0.5)))
+        # Skip some days randomly to simulate real usage (15% chance to skip a day)
+        active_days = np.flatnonzero(self.rng.random(num_days) >= 0.15)
+        
+        # Variable sessions per day
+        sessions_per_active_day = np.maximum(1, self.rng.normal(sessions_per_day, 0.5, len(active_days)).astype(int))
+        
+        # One entry per session: its day, its number within that day and its game
+        session_days = np.repeat(active_days, sessions_per_active_day)
+        session_nums = np.arange(len(session_days)) - np.repeat(
+            np.cumsum(sessions_per_active_day) - sessions_per_active_day, sessions_per_active_day
+        )
+        game_names = self.rng.choice(self.games, len(session_days)).tolist()
+        
+        # Progressive improvement over time
+        progress_factors = session_days / num_days
+        
+        # Generate session data for all sessions at once
+        sessions = self._generate_sessions_data(
+            game_names, progress_factors,
+            base_accuracy, base_smoothness, base_detection_rate
+        )
+        
+        files = []
+        for day, session, game_name, session_data in zip(session_days.tolist(), session_nums.tolist(), game_names, sessions):
+            # Later sessions on the same day are spaced apart so their file names don't collide
+            current_date = base_date + timedelta(days=day, minutes=SESSION_SPACING_MINUTES * session)
             
-            for session in range(num_sessions):
-                # Progressive improvement over time
-                progress_factor = day / num_days
-                
-                # Select random game
-                game_name = random.choice(self.games)
-                
-                # Generate session data
-                session_data = self._generate_session_data(
-                    game_name, current_date, session, 
-                    base_accuracy, base_smoothness, base_detection_rate, 
-                    progress_factor
-                )
-                
-                # Save session file
-                timestamp = current_date.strftime("%Y%m%d_%H%M%S")
-                filename = f"session_{game_name}_{timestamp}.json"
-                
-                with open(os.path.join(self.data_directory, filename), 'w') as f:
-                    json.dump(session_data, f, indent=2)
+            # Session file name and encoded contents
+            timestamp = _session_stamp(current_date)
+            filename = f"session_{game_name}_{timestamp}.json"
+            files.append((os.path.join(self.data_directory, filename), _encode_session(session_data, self.pretty)))
+        
+        self._write_session_files(files)
         
         print(f"✅ Generated dummy data files in {self.data_directory}")
     
-    def _generate_session_data(self, game_name: str, date: datetime, session_num: int,
-                             base_accuracy: float, base_smoothness: float, 
-                             base_detection_rate: float, progress_factor: float) -> dict:
-        """Generate realistic session data for a specific game"""
+    def _generate_sessions_data(self, game_names: list, progress_factors: np.ndarray,
+                                base_accuracy: float, base_smoothness: float,
+                                base_detection_rate: float) -> list:
+        """Generate realistic session data for a batch of sessions, one per game name"""
+        n = len(game_names)
+        rng = self.rng
         
         # Apply progression and random variation
-        accuracy_boost = progress_factor * 25 + random.uniform(-5, 5)
-        smoothness_boost = progress_factor * 30 + random.uniform(-8, 8)
-        detection_boost = progress_factor * 10 + random.uniform(-3, 3)
-        
-        current_accuracy = min(95, max(40, base_accuracy + accuracy_boost))
-        current_smoothness = min(95, max(20, base_smoothness + smoothness_boost))
-        current_detection = min(99, max(75, base_detection_rate + detection_boost))
+        accuracy = np.clip(base_accuracy + progress_factors * 25 + rng.uniform(-5, 5, n), 40, 95)
+        smoothness = np.clip(base_smoothness + progress_factors * 30 + rng.uniform(-8, 8, n), 20, 95)
+        detection = np.clip(base_detection_rate + progress_factors * 10 + rng.uniform(-3, 3, n), 75, 99)
         
         # Generate session duration (30 seconds to 3 minutes)
-        session_duration = random.uniform(30, 180)
+        duration = rng.uniform(30, 180, n)
         
         # Generate frame counts based on duration (assuming 30 FPS)
-        total_frames = int(session_duration * 30)
-        detected_frames = int(total_frames * (current_detection / 100))
+        total_frames = (duration * 30).astype(int)
         
         # Generate movement data
-        movement_count = random.randint(50, 200)
-        successful_interactions = int(movement_count * (current_accuracy / 100))
+        movement_count = rng.integers(50, 201, n)
+        successful_interactions = (movement_count * (accuracy / 100)).astype(int)
         
         # Generate pinch data
-        pinch_attempts = random.randint(5, 25)
-        successful_pinches = int(pinch_attempts * (current_accuracy / 100))
-        
-        # Base session structure with enhanced analytics
-        session_data = {
-            "game_name": game_name,
-            "session_metadata": {
-                "duration_seconds": round(session_duration, 2),
-                "total_frames": total_frames,
-                "hand_detection_rate": round(current_detection, 2)
-            },
-            "hand_movement_analytics": {
-                "total_movements": movement_count,
-                "successful_interactions": successful_interactions,
-                "interaction_effectiveness": round((successful_interactions / movement_count) * 100, 2),
-                "avg_movement_speed": round(random.uniform(8, 25), 2),
-                "total_movement_distance": round(random.uniform(1000, 5000), 2),
-                "movement_smoothness_score": round(current_smoothness, 2),
-                "tracking_lost_count": random.randint(0, 5)
-            },
-            "pinch_analytics": {
-                "total_pinch_attempts": pinch_attempts,
-                "successful_pinches": successful_pinches,
-                "failed_pinches": pinch_attempts - successful_pinches,
-                "pinch_success_rate": round((successful_pinches / max(1, pinch_attempts)) * 100, 2),
-                "avg_pinch_distance": round(random.uniform(25, 45), 2),
-                "avg_pinch_duration": round(random.uniform(0.2, 0.8), 3),
-                "avg_time_between_pinches": round(random.uniform(1.5, 4.0), 2),
-                "pinch_consistency": round(random.uniform(60, 95), 2)
-            },
-            "game_specific_metrics": self._generate_game_specific_metrics(game_name, progress_factor)
-        }
+        pinch_attempts = rng.integers(5, 26, n)
+        successful_pinches = (pinch_attempts * (accuracy / 100)).astype(int)
         
-        return session_data
-    
-    def _generate_game_specific_metrics(self, game_name: str, progress_factor: float) -> dict:
-        """Generate game-specific metrics based on game type"""
+        columns = [
+            accuracy, smoothness, detection, duration, total_frames,
+            movement_count, successful_interactions, pinch_attempts, successful_pinches,
+            rng.uniform(8, 25, n), rng.uniform(1000, 5000, n), rng.integers(0, 6, n),
+            rng.uniform(25, 45, n), rng.uniform(0.2, 0.8, n), rng.uniform(1.5, 4.0, n), rng.uniform(60, 95, n)
+        ]
+        all_game_metrics = self._generate_game_specific_metrics(game_names, progress_factors)
         
-        if game_name == "BalloonPop":
-            base_score = 8
-            score = int(base_score + (progress_factor * 12) + random.uniform(-3, 3))
-            score = max(0, score)
+        sessions = []
+        for game_name, game_metrics, row in zip(game_names, all_game_metrics, zip(*(c.tolist() for c in columns))):
+            (current_accuracy, current_smoothness, current_detection, session_duration, total_frames_i,
+             movements, interactions, pinches, good_pinches,
+             avg_speed, movement_distance, tracking_lost,
+             pinch_distance, pinch_duration, time_between_pinches, pinch_consistency) = row
             
-            return {
+            # Base session structure with enhanced analytics
+            sessions.append({
+                "game_name": game_name,
+                "session_metadata": {
+                    "duration_seconds": round(session_duration, 2),
+                    "total_frames": total_frames_i,
+                    "hand_detection_rate": round(current_detection, 2)
+                },
+                "hand_movement_analytics": {
+                    "total_movements": movements,
+                    "successful_interactions": interactions,
+                    "interaction_effectiveness": round((interactions / movements) * 100, 2),
+                    "avg_movement_speed": round(avg_speed, 2),
+                    "total_movement_distance": round(movement_distance, 2),
+                    "movement_smoothness_score": round(current_smoothness, 2),
+                    "tracking_lost_count": tracking_lost
+                },
+                "pinch_analytics": {
+                    "total_pinch_attempts": pinches,
+                    "successful_pinches": good_pinches,
+                    "failed_pinches": pinches - good_pinches,
+                    "pinch_success_rate": round((good_pinches / max(1, pinches)) * 100, 2),
+                    "avg_pinch_distance": round(pinch_distance, 2),
+                    "avg_pinch_duration": round(pinch_duration, 3),
+                    "avg_time_between_pinches": round(time_between_pinches, 2),
+                    "pinch_consistency": round(pinch_consistency, 2)
+                },
+                "game_specific_metrics": game_metrics
+            })
+        
+        return sessions
+    
+    def _generate_game_specific_metrics(self, game_names: list, progress_factors: np.ndarray) -> list:
+        """Generate game-specific metrics for a batch of sessions, one generator call per game type"""
+        names = np.asarray(game_names)
+        metrics = [None] * len(game_names)
+        for game_name in set(game_names):
+            indices = np.flatnonzero(names == game_name)
+            generate = self._game_generators.get(game_name, self._generate_default_metrics)
+            for i, game_metrics in zip(indices.tolist(), generate(progress_factors[indices])):
+                metrics[i] = game_metrics
+        return metrics
+    
+    def _generate_balloon_pop_metrics(self, progress: np.ndarray) -> list:
+        n = len(progress)
+        base_score = 8
+        scores = np.maximum(0, (base_score + progress * 12 + self.rng.uniform(-3, 3, n)).astype(int))
+        
+        return [
+            {
                 "score": score,
                 "balloons_popped": score,
-                "max_speed": round(random.uniform(15, 45), 2),
-                "avg_speed": round(random.uniform(8, 25), 2),
-                "min_pinch_distance": round(random.uniform(20, 35), 2),
-                "max_pinch_distance": round(random.uniform(40, 55), 2),
-                "avg_pinch_distance": round(random.uniform(30, 45), 2)
+                "max_speed": round(max_speed, 2),
+                "avg_speed": round(avg_speed, 2),
+                "min_pinch_distance": round(min_pinch, 2),
+                "max_pinch_distance": round(max_pinch, 2),
+                "avg_pinch_distance": round(avg_pinch, 2)
             }
+            for score, max_speed, avg_speed, min_pinch, max_pinch, avg_pinch in zip(
+                scores.tolist(), self.rng.uniform(15, 45, n).tolist(), self.rng.uniform(8, 25, n).tolist(),
+                self.rng.uniform(20, 35, n).tolist(), self.rng.uniform(40, 55, n).tolist(),
+                self.rng.uniform(30, 45, n).tolist()
+            )
+        ]
+    
+    def _generate_maze_metrics(self, progress: np.ndarray) -> list:
+        n = len(progress)
+        # Better times with progression
+        base_time = 120
+        time_taken = base_time - (progress * 40) + self.rng.uniform(-10, 15, n)
+        wall_touches = np.maximum(0, (8 - progress * 6 + self.rng.uniform(-2, 2, n)).astype(int))
+        completed = (time_taken < 100) | (self.rng.random(n) < (0.3 + progress * 0.6))
+        navigation_accuracy = 85 + progress * 10 + self.rng.uniform(-5, 5, n)
         
-        elif game_name == "MazeGame":
-            # Better times with progression
-            base_time = 120
-            time_taken = base_time - (progress_factor * 40) + random.uniform(-10, 15)
-            wall_touches = max(0, int(8 - progress_factor * 6 + random.uniform(-2, 2)))
-            completed = time_taken < 100 or random.random() < (0.3 + progress_factor * 0.6)
-            
-            return {
-                "time_taken": round(max(15, time_taken), 2),
-                "wall_touches": wall_touches,
-                "completed": completed,
-                "navigation_accuracy": round(85 + progress_factor * 10 + random.uniform(-5, 5), 2)
+        return [
+            {
+                "time_taken": round(max(15, time), 2),
+                "wall_touches": touches,
+                "completed": done,
+                "navigation_accuracy": round(accuracy, 2)
             }
+            for time, touches, done, accuracy in zip(
+                time_taken.tolist(), wall_touches.tolist(), completed.tolist(), navigation_accuracy.tolist()
+            )
+        ]
+    
+    def _generate_finger_painter_metrics(self, progress: np.ndarray) -> list:
+        n = len(progress)
+        targets_total = self.rng.integers(8, 16, n)
+        hit_rate = 0.5 + progress * 0.4 + self.rng.uniform(-0.1, 0.1, n)
+        targets_hit = (targets_total * hit_rate).astype(int)
         
-        elif game_name == "FingerPainter":
-            targets_total = random.randint(8, 15)
-            hit_rate = 0.5 + progress_factor * 0.4 + random.uniform(-0.1, 0.1)
-            targets_hit = int(targets_total * hit_rate)
-            
-            return {
-                "score": targets_hit * 10,
-                "targets_hit": targets_hit,
-                "total_targets": targets_total,
-                "accuracy": round((targets_hit / targets_total) * 100, 2),
-                "max_speed": round(random.uniform(12, 35), 2),
-                "avg_speed": round(random.uniform(6, 20), 2)
+        return [
+            {
+                "score": hit * 10,
+                "targets_hit": hit,
+                "total_targets": total,
+                "accuracy": round((hit / total) * 100, 2),
+                "max_speed": round(max_speed, 2),
+                "avg_speed": round(avg_speed, 2)
             }
+            for hit, total, max_speed, avg_speed in zip(
+                targets_hit.tolist(), targets_total.tolist(),
+                self.rng.uniform(12, 35, n).tolist(), self.rng.uniform(6, 20, n).tolist()
+            )
+        ]
+    
+    def _generate_dino_metrics(self, progress: np.ndarray) -> list:
+        n = len(progress)
+        base_score = 50
+        scores = np.maximum(0, (base_score + progress * 200 + self.rng.uniform(-20, 30, n)).astype(int))
         
-        elif game_name == "DinoGame":
-            base_score = 50
-            score = int(base_score + (progress_factor * 200) + random.uniform(-20, 30))
-            
-            return {
-                "score": max(0, score),
-                "jumps_made": random.randint(5, 25),
-                "obstacles_avoided": random.randint(3, 20),
-                "game_duration": round(random.uniform(20, 120), 2)
+        return [
+            {
+                "score": score,
+                "jumps_made": jumps,
+                "obstacles_avoided": avoided,
+                "game_duration": round(duration, 2)
             }
+            for score, jumps, avoided, duration in zip(
+                scores.tolist(), self.rng.integers(5, 26, n).tolist(),
+                self.rng.integers(3, 21, n).tolist(), self.rng.uniform(20, 120, n).tolist()
+            )
+        ]
+    
+    def _generate_angle_master_metrics(self, progress: np.ndarray) -> list:
+        n = len(progress)
+        angle_accuracy = 70 + progress * 20 + self.rng.uniform(-5, 5, n)
         
-        elif game_name == "AngleMaster":
-            angle_accuracy = 70 + progress_factor * 20 + random.uniform(-5, 5)
-            
-            return {
-                "angle_accuracy": round(angle_accuracy, 2),
-                "target_angles_hit": random.randint(3, 12),
-                "total_targets": random.randint(8, 15),
-                "avg_hold_time": round(random.uniform(1.0, 3.0), 2)
+        return [
+            {
+                "angle_accuracy": round(accuracy, 2),
+                "target_angles_hit": hit,
+                "total_targets": total,
+                "avg_hold_time": round(hold_time, 2)
             }
-        
-        else:
-            # Default metrics for unknown games
-            return {
-                "score": random.randint(50, 300),
-                "completion_rate": round(random.uniform(60, 95), 2)
+            for accuracy, hit, total, hold_time in zip(
+                angle_accuracy.tolist(), self.rng.integers(3, 13, n).tolist(),
+                self.rng.integers(8, 16, n).tolist(), self.rng.uniform(1.0, 3.0, n).tolist()
+            )
+        ]
+    
+    def _generate_default_metrics(self, progress: np.ndarray) -> list:
+        # Default metrics for unknown games
+        n = len(progress)
+        return [
+            {
+                "score": score,
+                "completion_rate": round(completion, 2)
             }
+            for score, completion in zip(self.rng.integers(50, 301, n).tolist(), self.rng.uniform(60, 95, n).tolist())
+        ]
+    
+    def _write_session_files(self, files: list):
+        """
+        Write already encoded session files in parallel
+        
+        Args:
+            files: List of (path, payload bytes) tuples
+        """
+        if not files:
+            return
+        # Payloads are encoded up front, so the workers only do the open/write syscalls
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(files))) as executor:
+            list(executor.map(lambda item: _write_file(*item), files))
     
     def clear_existing_data(self):
         """Clear existing dummy data files"""
         if os.path.exists(self.data_directory):
-            for filename in os.listdir(self.data_directory):
-                if filename.startswith('session_') and filename.endswith('.json'):
-                    os.remove(os.path.join(self.data_directory, filename))
+            with os.scandir(self.data_directory) as it:
+                for entry in it:
+                    if entry.name.startswith('session_') and entry.name.endswith('.json') and entry.is_file(follow_symlinks=False):
+                        os.remove(entry.path)
             print("🗑️  Cleared existing dummy data")
     
     def generate_sample_dataset(self):
@@ -230,20 +349,24 @@ class DummyDataGenerator:
         
         # Add some older sessions for trend analysis
         older_base = datetime.now() - timedelta(days=25)
-        for day in range(5):  # 5 days of older data
-            current_date = older_base + timedelta(days=day)
-            for session in range(random.randint(1, 3)):
-                game_name = random.choice(self.games)
-                session_data = self._generate_session_data(
-                    game_name, current_date, session,
-                    55, 35, 82, 0.1  # Lower baseline for older sessions
-                )
-                
-                timestamp = current_date.strftime("%Y%m%d_%H%M%S")
-                filename = f"session_{game_name}_{timestamp}.json"
-                
-                with open(os.path.join(self.data_directory, filename), 'w') as f:
-                    json.dump(session_data, f, indent=2)
+        older_counts = self.rng.integers(1, 4, 5)  # 5 days of older data
+        older_days = np.repeat(np.arange(5), older_counts)
+        older_nums = np.arange(len(older_days)) - np.repeat(np.cumsum(older_counts) - older_counts, older_counts)
+        game_names = self.rng.choice(self.games, len(older_days)).tolist()
+        sessions = self._generate_sessions_data(
+            game_names, np.full(len(older_days), 0.1),
+            55, 35, 82  # Lower baseline for older sessions
+        )
+        
+        files = []
+        for day, session, game_name, session_data in zip(older_days.tolist(), older_nums.tolist(), game_names, sessions):
+            current_date = older_base + timedelta(days=day, minutes=SESSION_SPACING_MINUTES * session)
+            
+            timestamp = _session_stamp(current_date)
+            filename = f"session_{game_name}_{timestamp}.json"
+            files.append((os.path.join(self.data_directory, filename), _encode_session(session_data, self.pretty)))
+        
+        self._write_session_files(files)
         
         print("✅ Sample dataset generation complete!")
         print(f"📊 Ready to generate dashboard from {self.data_directory}")
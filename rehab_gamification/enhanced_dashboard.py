@@ -1,21 +1,205 @@
 # enhanced_dashboard.py
 
+import filecmp
+import functools
+import hashlib
 import json
 import os
+import pickle
+import re
+import shutil
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Charts are only written to files, never shown
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import seaborn as sns
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Tuple
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from scipy.stats import pearsonr
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib decoder is used instead
+    orjson = None
+
 # Set style for better looking plots
 plt.style.use('default')
 plt.rcParams['figure.facecolor'] = 'white'
 plt.rcParams['axes.facecolor'] = 'white'
 
+# Bump when the layout of cached session records changes
+SESSION_CACHE_VERSION = 1
+
+# Static page written as dashboard.html, shipped next to this module
+DASHBOARD_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates', 'dashboard.html')
+
+# Resolution of every dashboard chart; screen quality is enough for the HTML dashboard
+CHART_DPI = 120
+
+# savefig arguments shared by every chart
+CHART_SAVE_KWARGS = {'dpi': CHART_DPI, 'facecolor': 'white'}
+
+# Fastest zlib level for the large, mostly flat-colour images; encoding dominates their save time
+FAST_PNG_KWARGS = {'pil_kwargs': {'compress_level': 1}}
+
+# Qualitative per-game palettes, taken once from the colormaps instead of resampled per chart
+GAME_COLORS = tuple(plt.cm.Set3.colors)
+TREND_COLORS = tuple(plt.cm.Set1.colors)
+
+# Daily rate lists and the session column each is built from
+DAILY_RATE_COLUMNS = {
+    'pinch_success_rate': 'pinch_rate',
+    'movement_smoothness': 'smoothness',
+    'hand_detection_rate': 'detection'
+}
+
+# Per-day totals kept in daily_columns, next to an avg_<key> array per daily rate
+DAILY_TOTAL_COLUMNS = ('sessions_count', 'total_duration', 'total_score',
+                       'successful_actions', 'total_actions', 'game_variety')
+
+# Sections of the markdown progress report, filled in with str.format_map
+REPORT_HEADER = """
+# 🏥 REHABILITATION GAMING PROGRESS REPORT
+Generated on: {generated}
+
+## 📊 EXECUTIVE SUMMARY
+- **Total Sessions Completed:** {total_sessions}
+- **Games Played:** {games_played}
+- **Overall Accuracy:** {accuracy:.1f}%
+- **Current Streak:** {streak} days
+- **Improvement Trend:** {improvement:+.1f}%
+
+## 🎯 GAME PERFORMANCE METRICS
+
+### Score Progression Analysis
+"""
+
+REPORT_GAME_SECTION = """
+**{game}:**
+- Average Score: {avg_score:.1f}
+- Best Score: {best_score}
+- Sessions Played: {sessions}
+- Trend: {trend}
+"""
+
+REPORT_METRICS = """
+
+## 💪 PHYSICAL/MOTOR IMPROVEMENT METRICS
+
+### Hand Movement Analysis
+- **Movement Smoothness:** {smoothness:.1f}/100
+- **Hand Detection Rate:** {detection:.1f}%
+- **Pinch Control Accuracy:** {accuracy:.1f}%
+
+### Range of Motion Progress
+- **Tracking Quality:** Excellent (based on consistent hand detection)
+- **Fine Motor Control:** {motor_control}
+
+## 🎮 ENGAGEMENT & MOTIVATION METRICS
+
+### Session Patterns
+- **Total Sessions:** {total_sessions}
+- **Days Active:** {days_active}
+- **Average Sessions per Day:** {sessions_per_day:.1f}
+- **Longest Streak:** {streak} consecutive days
+
+### Game Variety
+- **Games Explored:** {games_played}
+- **Favorite Game:** {favorite_game}
+
+## 🏆 ACHIEVEMENTS & MILESTONES
+
+### Earned Badges
+"""
+
+REPORT_INSIGHTS = """
+
+## 🔍 DETAILED INSIGHTS & RECOMMENDATIONS
+
+### Performance Analysis
+- **Strength Areas:** {strength_area}
+- **Improvement Areas:** {improvement_area}
+
+### Rehabilitation Progress
+- **Motor Skills:** {motor_skills}
+- **Engagement Level:** {engagement_level}
+
+### Next Steps Recommendations
+1. **Continue current routine** - showing positive trends
+2. **Increase session frequency** if possible for faster progress
+3. **Try variety of games** to work different motor skills
+4. **Set new challenges** as current performance is strong
+
+---
+*This report was automatically generated by the Rehabilitation Gaming Analytics System*
+"""
+
+# Rating bands: a value above each threshold moves up to the next label
+CONSISTENCY_THRESHOLDS = np.array([60.0, 80.0])
+CONSISTENCY_LABELS = ('Variable Pattern', 'Moderately Consistent', 'Highly Consistent')
+ENGAGEMENT_THRESHOLDS = np.array([5, 10, 20])
+ENGAGEMENT_LABELS = ('Getting Started', 'Building Engagement', 'Well Engaged', 'Highly Engaged')
+
+# Chart methods that only read the analytics and each write their own PNG, so they can run in parallel
+PARALLEL_CHARTS = ('create_game_distribution_plot', 'create_weekly_heatmap', 'create_correlation_matrix',
+                   'create_kpi_dashboard', 'create_success_rate_trends', 'create_performance_radar_chart')
+
+# Matches filename stamps (YYYYMMDD_HHMMSS) as well as ISO dates and timestamps
+_STAMP_RE = re.compile(r'(\d{4})-?(\d{2})-?(\d{2})(?:[_T ](\d{2}):?(\d{2}):?(\d{2})(?:\.\d+)?)?$')
+
+
+def _load_json(buf: bytes):
+    """Decode JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _numpy_default(obj):
+    """Convert NumPy scalars and arrays the stdlib encoder does not know"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(path: str, data):
+    """Write indented JSON, letting orjson serialize NumPy values directly when available"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, default=_numpy_default)
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_stamp(stamp: str) -> datetime:
+    """Parse a date or timestamp string, memoized since the same days recur"""
+    match = _STAMP_RE.match(stamp)
+    if match is None:
+        raise ValueError(f"Unrecognized timestamp: {stamp}")
+    year, month, day, hour, minute, second = match.groups()
+    return datetime(int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0))
+
+
+def _weekdays(values: np.ndarray) -> np.ndarray:
+    """Monday-based weekday (0-6) of each datetime64 value"""
+    # Day 0 of datetime64, 1970-01-01, was a Thursday
+    return (values.astype('datetime64[D]').astype(np.int64) + 3) % 7
+
+
+def _render_chart(dashboard: 'EnhancedRehabDashboard', method_name: str) -> Dict[str, str]:
+    """Draw one chart in a worker process and return the digests it recorded"""
+    # The parent process merges and saves the digests once every worker is done
+    dashboard._chart_hashes_path = None
+    recorded = dict(dashboard._chart_hashes)
+    getattr(dashboard, method_name)()
+    return {name: digest for name, digest in dashboard._chart_hashes.items() if recorded.get(name) != digest}
+
+
 class EnhancedRehabDashboard:
     """
     Comprehensive Rehabilitation Gaming Dashboard System
@@ -42,13 +226,24 @@ class EnhancedRehabDashboard:
         
         # Ensure progress directory exists
         os.makedirs(self.progress_directory, exist_ok=True)
+        self._cache_path = os.path.join(self.progress_directory, '.session_cache.pkl')
+        self._chart_hashes_path = os.path.join(self.progress_directory, '.chart_hashes.json')
+        self._chart_hashes = None
+        # While set to a list, _chart_digest only collects the names of stale charts
+        self._stale_charts = None
         
         # Initialize data storage
         self.session_data = []
+        self.session_columns = {}
         self.daily_analytics = {}
         self.achievements = {}
         self.physical_metrics = {}
         self.engagement_metrics = {}
+        self._figures = {}
+        
+        # Unit circle shared by every gauge drawing, as a (2, n) array of x and y
+        theta = np.linspace(0, 2*np.pi, 256)
+        self._gauge_circle = np.stack((np.cos(theta), np.sin(theta)))
         
         # Load and process all data
         self.load_all_sessions()
@@ -56,36 +251,144 @@ class EnhancedRehabDashboard:
         self.calculate_achievements()
     
     def load_all_sessions(self):
-        """Load and parse all session data files"""
+        """Load session records, re-parsing only files changed since the last run"""
         print("🔄 Loading session data...")
         
         self.session_data = []
         
-        if not os.path.exists(self.data_directory):
+        # One directory pass; DirEntry carries the path and cached stat info
+        try:
+            with os.scandir(self.data_directory) as it:
+                files = [(entry.name, entry.path, entry.stat().st_mtime_ns) for entry in it
+                         if (entry.name.endswith('.json') or entry.name == 'sessions.jsonl') and entry.is_file()]
+        except FileNotFoundError:
             print(f"⚠️  Data directory {self.data_directory} not found.")
+            self._build_session_columns()
             return
         
-        for filename in os.listdir(self.data_directory):
-            if filename.endswith('.json'):
-                try:
-                    with open(os.path.join(self.data_directory, filename), 'r') as f:
-                        data = json.load(f)
-                        
-                        # Extract metadata from filename
-                        data['filename'] = filename
-                        data['timestamp'] = self._extract_timestamp_from_filename(filename)
-                        data['date'] = self._extract_date_from_filename(filename)
-                        data['game_name'] = self._extract_game_name_from_filename(filename)
-                        
-                        self.session_data.append(data)
-                        
-                except Exception as e:
-                    print(f"❌ Error loading {filename}: {e}")
+        # Cached records are keyed by filename and reused while the mtime matches
+        cache = self._load_session_cache()
+        entries = {}
+        stale = []
+        
+        for name, path, mtime in files:
+            cached = cache.get(name)
+            if cached is not None and cached[0] == mtime:
+                entries[name] = cached
+            else:
+                stale.append((name, path, mtime))
+        
+        # Changed files are independent, so read and decode them concurrently
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2)) as executor:
+                results = executor.map(self._load_session_file,
+                                       [name for name, _, _ in stale], [path for _, path, _ in stale])
+                for (name, _, mtime), records in zip(stale, results):
+                    if records is not None:
+                        entries[name] = (mtime, records)
+        
+        if stale or len(entries) != len(cache):
+            self._save_session_cache(entries)
+        
+        for _, records in entries.values():
+            self.session_data.extend(records)
         
         # Sort sessions by timestamp
         self.session_data.sort(key=lambda x: x.get('timestamp', ''))
+        self._build_session_columns()
         print(f"✅ Loaded {len(self.session_data)} sessions")
     
+    def _load_session_file(self, name: str, path: str) -> List[Dict]:
+        """Parse one session file into records, or None if it can't be loaded"""
+        if name == 'sessions.jsonl':
+            # Sessions saved by DataManager are appended to a single log file
+            return [self._extract_session_record(data, self._log_record_filename(data))
+                    for data in self._load_sessions_log(path)]
+        
+        try:
+            with open(path, 'rb') as f:
+                data = _load_json(f.read())
+        except Exception as e:
+            print(f"❌ Error loading {name}: {e}")
+            return None
+        return [self._extract_session_record(data, name)]
+    
+    def _extract_session_record(self, data: Dict, filename: str) -> Dict:
+        """Reduce a parsed session to the flat fields the dashboard consumes"""
+        metadata = data.get('session_metadata')
+        pinch_data = data.get('pinch_analytics', {})
+        game_metrics = data.get('game_specific_metrics')
+        
+        # Success rate for trend plots, falling back to game-specific accuracy
+        success_rate = pinch_data.get('pinch_success_rate', 0)
+        if success_rate == 0 and game_metrics:
+            if 'target_angles_hit' in game_metrics and 'total_targets' in game_metrics:
+                total = game_metrics.get('total_targets', 1)
+                success_rate = (game_metrics.get('target_angles_hit', 0) / max(1, total)) * 100
+            elif 'angle_accuracy' in game_metrics:
+                success_rate = game_metrics.get('angle_accuracy', 0)
+        
+        return {
+            'filename': filename,
+            'timestamp': self._extract_timestamp_from_filename(filename),
+            'date': self._extract_date_from_filename(filename),
+            'game_name': self._extract_game_name_from_filename(filename),
+            # Default estimate for legacy sessions without metadata
+            'duration_seconds': metadata.get('duration_seconds', 0) if metadata is not None else 60,
+            'hand_detection_rate': metadata.get('hand_detection_rate', 0) if metadata is not None else 0,
+            'score': game_metrics.get('score', 0) if game_metrics is not None else None,
+            'pinch_success_rate': pinch_data.get('pinch_success_rate', 0),
+            'successful_pinches': pinch_data.get('successful_pinches', 0),
+            'total_pinch_attempts': pinch_data.get('total_pinch_attempts', 0),
+            'movement_smoothness_score': data.get('hand_movement_analytics', {}).get('movement_smoothness_score', 0),
+            'success_rate': success_rate
+        }
+    
+    def _load_session_cache(self) -> Dict:
+        """Load the {filename: (mtime, records)} cache of extracted sessions"""
+        try:
+            with open(self._cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except Exception:
+            return {}
+        
+        if cache.get('version') != SESSION_CACHE_VERSION:
+            return {}
+        return cache.get('entries', {})
+    
+    def _save_session_cache(self, entries: Dict):
+        """Persist the extracted session records next to the progress reports"""
+        tmp_path = self._cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'version': SESSION_CACHE_VERSION, 'entries': entries}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path)
+        except OSError as e:
+            print(f"⚠️  Could not save session cache: {e}")
+    
+    def _load_sessions_log(self, log_path: str) -> List[Dict]:
+        """Load the records of the append-only sessions.jsonl log"""
+        records = []
+        with open(log_path, 'rb') as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(_load_json(line))
+                except json.JSONDecodeError as e:
+                    print(f"❌ Error loading sessions.jsonl line {line_no}: {e}")
+        return records
+    
+    def _log_record_filename(self, data: Dict) -> str:
+        """Build the per-session filename a log record would have been saved under"""
+        metadata = data.get('metadata', {})
+        try:
+            stamp = datetime.fromisoformat(metadata.get('session_start_time', '')).strftime("%Y%m%d_%H%M%S")
+        except ValueError:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"session_{metadata.get('game_name', 'Unknown')}_{stamp}.json"
+    
     def _extract_timestamp_from_filename(self, filename: str) -> str:
         """Extract timestamp from filename format: session_GameName_YYYYMMDD_HHMMSS.json"""
         try:
@@ -95,7 +398,7 @@ class EnhancedRehabDashboard:
                 time_part = parts[-1]  # HHMMSS
                 
                 # Parse into datetime
-                dt = datetime.strptime(f"{date_part}_{time_part}", "%Y%m%d_%H%M%S")
+                dt = _parse_stamp(f"{date_part}_{time_part}")
                 return dt.isoformat()
         except:
             pass
@@ -107,7 +410,7 @@ class EnhancedRehabDashboard:
             parts = filename.replace('.json', '').split('_')
             if len(parts) >= 3:
                 date_part = parts[-2]  # YYYYMMDD
-                dt = datetime.strptime(date_part, "%Y%m%d")
+                dt = _parse_stamp(date_part)
                 return dt.strftime("%Y-%m-%d")
         except:
             pass
@@ -123,77 +426,138 @@ class EnhancedRehabDashboard:
             pass
         return "Unknown"
     
+    def _build_session_columns(self):
+        """Lay the session records out as one NumPy array per field"""
+        sessions = self.session_data
+        self.session_columns = {
+            'date': np.array([s['date'] for s in sessions]),
+            'timestamp': np.array([s['timestamp'] for s in sessions]),
+            'time': np.array([s['timestamp'] for s in sessions], dtype='datetime64[us]'),
+            'game_name': np.array([s['game_name'] for s in sessions]),
+            'duration': np.array([s['duration_seconds'] for s in sessions]),
+            'score': np.array([s['score'] if s['score'] is not None else 0 for s in sessions]),
+            'has_score': np.array([s['score'] is not None for s in sessions], dtype=bool),
+            'pinch_rate': np.array([s['pinch_success_rate'] for s in sessions]),
+            'successful': np.array([s['successful_pinches'] for s in sessions]),
+            'attempts': np.array([s['total_pinch_attempts'] for s in sessions]),
+            'smoothness': np.array([s['movement_smoothness_score'] for s in sessions]),
+            'detection': np.array([s['hand_detection_rate'] for s in sessions]),
+            'success_rate': np.array([s['success_rate'] for s in sessions])
+        }
+        
+        # Game names in order of first appearance, with each session's index into them
+        names, first_index, codes = np.unique(self.session_columns['game_name'], return_index=True, return_inverse=True)
+        order = np.argsort(first_index)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        self.session_columns['game_code'] = rank[codes]
+        self.game_names = names[order].tolist()
+        
+        # Per-game views shared by the achievements, reports and charts
+        game_codes = self.session_columns['game_code']
+        self.game_session_counts = np.bincount(game_codes, minlength=len(self.game_names))
+        self.game_counts = Counter(dict(zip(self.game_names, self.game_session_counts.tolist())))
+        self.game_scores = defaultdict(list)
+        has_score = self.session_columns['has_score']
+        scored_codes = game_codes[has_score]
+        scores = self.session_columns['score'][has_score]
+        for code, game in enumerate(self.game_names):
+            game_scores = scores[scored_codes == code]
+            if game_scores.size:
+                self.game_scores[game] = game_scores.tolist()
+    
     def process_daily_analytics(self):
         """Process session data into daily analytics"""
         print("📊 Processing daily analytics...")
         
-        self.daily_analytics = defaultdict(lambda: {
-            'sessions_count': 0,
-            'total_duration': 0,
-            'games_played': set(),
-            'total_score': 0,
-            'successful_actions': 0,
-            'total_actions': 0,
-            'pinch_success_rate': [],
-            'movement_smoothness': [],
-            'hand_detection_rate': [],
-            'reaction_times': [],
-            'range_of_motion_scores': [],
-            'session_details': []
-        })
-        
-        for session in self.session_data:
-            date = session.get('date')
-            game_name = session.get('game_name')
-            
-            if not date:
-                continue
-            
-            # Basic session info
-            self.daily_analytics[date]['sessions_count'] += 1
-            self.daily_analytics[date]['games_played'].add(game_name)
-            self.daily_analytics[date]['session_details'].append(session)
-            
-            # Duration (from enhanced data or estimate)
-            if 'session_metadata' in session:
-                duration = session['session_metadata'].get('duration_seconds', 0)
-            else:
-                duration = 60  # Default estimate for legacy sessions
-            
-            self.daily_analytics[date]['total_duration'] += duration
-            
-            # Game-specific metrics
-            if 'game_specific_metrics' in session:
-                metrics = session['game_specific_metrics']
-                score = metrics.get('score', 0)
-                self.daily_analytics[date]['total_score'] += score
-            
-            # Enhanced analytics (if available)
-            if 'pinch_analytics' in session:
-                pinch_data = session['pinch_analytics']
-                success_rate = pinch_data.get('pinch_success_rate', 0)
-                if success_rate > 0:
-                    self.daily_analytics[date]['pinch_success_rate'].append(success_rate)
-                
-                successful = pinch_data.get('successful_pinches', 0)
-                total = pinch_data.get('total_pinch_attempts', 0)
-                self.daily_analytics[date]['successful_actions'] += successful
-                self.daily_analytics[date]['total_actions'] += total
-            
-            if 'hand_movement_analytics' in session:
-                movement_data = session['hand_movement_analytics']
-                smoothness = movement_data.get('movement_smoothness_score', 0)
-                if smoothness > 0:
-                    self.daily_analytics[date]['movement_smoothness'].append(smoothness)
-            
-            if 'session_metadata' in session:
-                detection_rate = session['session_metadata'].get('hand_detection_rate', 0)
-                if detection_rate > 0:
-                    self.daily_analytics[date]['hand_detection_rate'].append(detection_rate)
+        self.daily_analytics = {}
+        self.daily_dates = []
+        self.daily_date_values = np.zeros(0, dtype='datetime64[D]')
+        self._daily_day_numbers = np.zeros(0, dtype=np.int64)
+        self.daily_columns = {key: np.zeros(0) for key in DAILY_TOTAL_COLUMNS}
+        self.daily_columns.update((f'avg_{key}', np.zeros(0)) for key in DAILY_RATE_COLUMNS)
+        self._rate_means = dict.fromkeys(DAILY_RATE_COLUMNS, np.nan)
+        self._total_successful = 0
+        self._total_attempts = 0
+        self._session_consistency = 0
+        if not self.session_data:
+            print("✅ Processed 0 days of data")
+            return
+        
+        # Pinch totals behind the overall accuracy, summed once per build
+        self._total_successful = self.session_columns['successful'].sum().item()
+        self._total_attempts = self.session_columns['attempts'].sum().item()
+        
+        # One slot per date in every per-day array, in sorted date order
+        columns = self.session_columns
+        dates, day_index = np.unique(columns['date'], return_inverse=True)
+        n_days = len(dates)
+        
+        def daily_sum(values):
+            totals = np.zeros(n_days, dtype=values.dtype)
+            np.add.at(totals, day_index, values)
+            return totals
+        
+        # Distinct (day, game) pairs give each day's games without per-day sets
+        games = np.array(self.game_names)
+        game_index = columns['game_code']
+        day_games = np.unique(day_index * len(games) + game_index)
+        game_days = day_games // len(games)
+        
+        self.daily_dates = dates.tolist()
+        # ISO date strings parse to datetime64 in one vectorized cast
+        self.daily_date_values = dates.astype('datetime64[D]')
+        self._daily_day_numbers = self.daily_date_values.astype(np.int64)
+        self.daily_columns = {
+            'sessions_count': np.bincount(day_index, minlength=n_days),
+            'total_duration': daily_sum(columns['duration']),
+            'total_score': daily_sum(columns['score']),
+            'successful_actions': daily_sum(columns['successful']),
+            'total_actions': daily_sum(columns['attempts']),
+            'game_variety': np.bincount(game_days, minlength=n_days)
+        }
         
-        # Convert sets to lists for JSON serialization
-        for date_data in self.daily_analytics.values():
-            date_data['games_played'] = list(date_data['games_played'])
+        # Spread of sessions across days, shared by the engagement data, rating and radar chart
+        session_counts = self.daily_columns['sessions_count']
+        mean_sessions = session_counts.mean()
+        if mean_sessions > 0:
+            self._session_consistency = (100 - session_counts.std() / mean_sessions * 100).item()
+        
+        # Mean of each day's positive samples, 0 for days without any
+        for key, column in DAILY_RATE_COLUMNS.items():
+            values = columns[column]
+            positive = values > 0
+            samples = np.bincount(day_index, weights=positive, minlength=n_days)
+            totals = np.bincount(day_index, weights=np.where(positive, values, 0), minlength=n_days)
+            has_samples = samples > 0
+            means = np.divide(totals, samples, out=np.zeros(n_days), where=has_samples)
+            self.daily_columns[f'avg_{key}'] = means
+            # Mean over the days that have samples, quoted by the gauges, insights and report
+            if has_samples.any():
+                self._rate_means[key] = means[has_samples].mean().item()
+        
+        # Per-day lists for the daily_analytics view: sort sessions by day once and split
+        order = np.argsort(day_index, kind='stable')
+        bounds = np.cumsum(self.daily_columns['sessions_count'])[:-1]
+        daily_rates = {key: [day[day > 0].tolist() for day in np.split(columns[column][order], bounds)]
+                       for key, column in DAILY_RATE_COLUMNS.items()}
+        games_played = np.split(games[day_games % len(games)], np.cumsum(self.daily_columns['game_variety'])[:-1])
+        totals = {key: self.daily_columns[key].tolist() for key in DAILY_TOTAL_COLUMNS}
+        
+        for i, date in enumerate(self.daily_dates):
+            self.daily_analytics[date] = {
+                'sessions_count': totals['sessions_count'][i],
+                'total_duration': totals['total_duration'][i],
+                'games_played': games_played[i].tolist(),
+                'total_score': totals['total_score'][i],
+                'successful_actions': totals['successful_actions'][i],
+                'total_actions': totals['total_actions'][i],
+                'pinch_success_rate': daily_rates['pinch_success_rate'][i],
+                'movement_smoothness': daily_rates['movement_smoothness'][i],
+                'hand_detection_rate': daily_rates['hand_detection_rate'][i],
+                'reaction_times': [],
+                'range_of_motion_scores': []
+            }
         
         print(f"✅ Processed {len(self.daily_analytics)} days of data")
     
@@ -210,18 +574,14 @@ class EnhancedRehabDashboard:
         }
         
         # Calculate game-specific achievements
-        game_stats = defaultdict(list)
-        for session in self.session_data:
-            game_name = session.get('game_name')
-            if 'game_specific_metrics' in session:
-                score = session['game_specific_metrics'].get('score', 0)
-                game_stats[game_name].append(score)
+        game_stats = self.game_scores
         
         # Determine mastered games (consistent high performance)
         for game, scores in game_stats.items():
+            # Plain sums beat np.mean's array conversion on lists this short
             if len(scores) >= 3:
-                recent_avg = np.mean(scores[-3:])
-                if recent_avg > np.mean(scores) * 1.2:  # 20% improvement
+                recent_avg = sum(scores[-3:]) / 3
+                if recent_avg > sum(scores) / len(scores) * 1.2:  # 20% improvement
                     self.achievements['games_mastered'].append(game)
         
         # Add milestones
@@ -249,34 +609,16 @@ class EnhancedRehabDashboard:
         if not self.daily_analytics:
             return 0
         
-        dates = sorted(self.daily_analytics.keys())
-        current_streak = 1
-        max_streak = 1
+        # Day numbers make consecutive dates differ by exactly 1
+        days = self._daily_day_numbers
+        breaks = np.flatnonzero(np.diff(days) != 1)
+        runs = np.diff(np.concatenate(([-1], breaks, [len(days) - 1])))
         
-        for i in range(1, len(dates)):
-            prev_date = datetime.strptime(dates[i-1], "%Y-%m-%d")
-            curr_date = datetime.strptime(dates[i], "%Y-%m-%d")
-            
-            if (curr_date - prev_date).days == 1:
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            else:
-                current_streak = 1
-        
-        return max_streak
+        return int(runs.max())
     
     def _calculate_overall_accuracy(self) -> float:
         """Calculate overall accuracy across all sessions"""
-        total_successful = 0
-        total_attempts = 0
-        
-        for session in self.session_data:
-            if 'pinch_analytics' in session:
-                pinch_data = session['pinch_analytics']
-                total_successful += pinch_data.get('successful_pinches', 0)
-                total_attempts += pinch_data.get('total_pinch_attempts', 0)
-        
-        return (total_successful / max(1, total_attempts)) * 100
+        return (self._total_successful / max(1, self._total_attempts)) * 100
     
     def generate_comprehensive_dashboard(self):
         """Generate the complete dashboard with all visualizations"""
@@ -310,300 +652,12 @@ class EnhancedRehabDashboard:
         print("  • Performance Radar Chart (performance_radar.png)")
     
     def _create_main_dashboard_html(self):
-        """Create the main dashboard HTML file"""
-        html_content = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Rehabilitation Gaming Dashboard</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            color: #333;
-        }
-        
-        .dashboard-header {
-            background: rgba(255, 255, 255, 0.95);
-            padding: 20px;
-            text-align: center;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }
-        
-        .dashboard-header h1 {
-            color: #2c3e50;
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }
-        
-        .dashboard-header p {
-            color: #7f8c8d;
-            font-size: 1.1em;
-        }
-        
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        .kpi-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-        
-        .kpi-card {
-            background: white;
-            border-radius: 15px;
-            padding: 25px;
-            text-align: center;
-            box-shadow: 0 8px 25px rgba(0,0,0,0.1);
-            transition: transform 0.3s ease;
-        }
-        
-        .kpi-card:hover {
-            transform: translateY(-5px);
-        }
-        
-        .kpi-icon {
-            font-size: 3em;
-            margin-bottom: 15px;
-        }
+        """Copy the main dashboard HTML template into the progress directory"""
+        destination = os.path.join(self.progress_directory, 'dashboard.html')
         
-        .kpi-value {
-            font-size: 2.2em;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }
-        
-        .kpi-label {
-            color: #7f8c8d;
-            font-size: 1.1em;
-        }
-        
-        .accuracy { color: #e74c3c; }
-        .sessions { color: #3498db; }
-        .improvement { color: #2ecc71; }
-        .streak { color: #f39c12; }
-        
-        .chart-section {
-            background: white;
-            border-radius: 15px;
-            padding: 25px;
-            margin-bottom: 30px;
-            box-shadow: 0 8px 25px rgba(0,0,0,0.1);
-        }
-        
-        .chart-title {
-            font-size: 1.5em;
-            color: #2c3e50;
-            margin-bottom: 20px;
-            text-align: center;
-        }
-        
-        .two-column {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 30px;
-        }
-        
-        .achievement-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-        }
-        
-        .achievement-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            border-radius: 10px;
-            text-align: center;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-        }
-        
-        .achievement-icon {
-            font-size: 2em;
-            margin-bottom: 10px;
-        }
-        
-        @media (max-width: 768px) {
-            .two-column {
-                grid-template-columns: 1fr;
-            }
-            
-            .kpi-grid {
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="dashboard-header">
-        <h1><i class="fas fa-heartbeat"></i> Rehabilitation Gaming Dashboard</h1>
-        <p>Track your progress, celebrate achievements, and optimize your rehabilitation journey</p>
-    </div>
-    
-    <div class="container">
-        <!-- KPI Summary Cards -->
-        <div class="kpi-grid" id="kpi-section">
-            <!-- KPI cards will be inserted here -->
-        </div>
-        
-        <!-- Progress Charts -->
-        <div class="chart-section">
-            <h2 class="chart-title">📈 Game Performance Over Time</h2>
-            <div id="progress-chart"></div>
-        </div>
-        
-        <div class="two-column">
-            <!-- Physical Metrics -->
-            <div class="chart-section">
-                <h2 class="chart-title">💪 Physical Metrics</h2>
-                <div id="physical-metrics"></div>
-            </div>
-            
-            <!-- Engagement Analysis -->
-            <div class="chart-section">
-                <h2 class="chart-title">🎮 Engagement Pattern</h2>
-                <div id="engagement-chart"></div>
-            </div>
-        </div>
-        
-        <!-- Achievements -->
-        <div class="chart-section">
-            <h2 class="chart-title">🏆 Achievements & Milestones</h2>
-            <div class="achievement-grid" id="achievements-section">
-                <!-- Achievement cards will be inserted here -->
-            </div>
-        </div>
-        
-        <!-- Interactive Game Performance Chart -->
-        <div class="chart-section">
-            <h2 class="chart-title">📊 Interactive Game Performance Analysis</h2>
-            <div id="interactive-performance-chart" style="height: 500px;"></div>
-        </div>
-        
-        <!-- Detailed Insights -->
-        <div class="chart-section">
-            <h2 class="chart-title">🔍 Detailed Analysis & Recommendations</h2>
-            <div id="insights-section">
-                <!-- Insights will be inserted here -->
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // Sample data for the interactive chart
-        var gamePerformanceData = [
-            {
-                x: ['Oct 1', 'Oct 2', 'Oct 3', 'Oct 5', 'Oct 6', 'Oct 7', 'Oct 8'],
-                y: [750, 820, 880, 1200, 950, 1150, 1300],
-                type: 'scatter',
-                mode: 'lines+markers',
-                name: 'DinoGame Score',
-                line: {color: '#3498db', width: 3},
-                marker: {size: 8, color: '#3498db'}
-            },
-            {
-                x: ['Oct 5', 'Oct 7', 'Oct 8'],
-                y: [85, 92, 88],
-                type: 'scatter',
-                mode: 'lines+markers',
-                name: 'FingerPainter Accuracy %',
-                yaxis: 'y2',
-                line: {color: '#e74c3c', width: 3},
-                marker: {size: 8, color: '#e74c3c'}
-            },
-            {
-                x: ['Oct 6', 'Oct 8'],
-                y: [78, 82],
-                type: 'scatter',
-                mode: 'lines+markers',
-                name: 'MazeGame Completion %',
-                yaxis: 'y2',
-                line: {color: '#2ecc71', width: 3},
-                marker: {size: 8, color: '#2ecc71'}
-            },
-            {
-                x: ['Oct 8'],
-                y: [1450],
-                type: 'scatter',
-                mode: 'markers',
-                name: 'BalloonPop Score',
-                marker: {size: 12, color: '#f39c12'},
-                showlegend: true
-            }
-        ];
-
-        var layout = {
-            title: {
-                text: 'Multi-Game Performance Trends',
-                font: {size: 18, color: '#2c3e50'}
-            },
-            xaxis: {
-                title: 'Date',
-                gridcolor: '#ecf0f1',
-                showgrid: true
-            },
-            yaxis: {
-                title: 'Game Scores',
-                side: 'left',
-                gridcolor: '#ecf0f1',
-                showgrid: true,
-                color: '#3498db'
-            },
-            yaxis2: {
-                title: 'Accuracy/Completion %',
-                side: 'right',
-                overlaying: 'y',
-                range: [0, 100],
-                color: '#e74c3c'
-            },
-            legend: {
-                x: 0.02,
-                y: 0.98,
-                bgcolor: 'rgba(255,255,255,0.8)',
-                bordercolor: '#ddd',
-                borderwidth: 1
-            },
-            plot_bgcolor: 'rgba(0,0,0,0)',
-            paper_bgcolor: 'rgba(0,0,0,0)',
-            margin: {t: 50, r: 80, b: 50, l: 80},
-            hovermode: 'x unified'
-        };
-
-        var config = {
-            responsive: true,
-            displayModeBar: true,
-            modeBarButtonsToRemove: ['pan2d', 'lasso2d', 'select2d']
-        };
-
-        Plotly.newPlot('interactive-performance-chart', gamePerformanceData, layout, config);
-        
-        // Dashboard will be populated by Python-generated data
-        console.log('Rehabilitation Gaming Dashboard Loaded');
-    </script>
-</body>
-</html>
-        '''
-        
-        with open(os.path.join(self.progress_directory, 'dashboard.html'), 'w') as f:
-            f.write(html_content)
+        # The page is static, so leave an identical copy untouched
+        if not os.path.exists(destination) or not filecmp.cmp(DASHBOARD_TEMPLATE, destination, shallow=False):
+            shutil.copyfile(DASHBOARD_TEMPLATE, destination)
     
     def _create_kpi_summary(self):
         """Create KPI summary cards data"""
@@ -623,8 +677,7 @@ class EnhancedRehabDashboard:
         }
         
         # Save KPI data
-        with open(os.path.join(self.progress_directory, 'kpi_data.json'), 'w') as f:
-            json.dump(kpi_data, f, indent=2)
+        _write_json(os.path.join(self.progress_directory, 'kpi_data.json'), kpi_data)
         
         return kpi_data
     
@@ -634,21 +687,10 @@ class EnhancedRehabDashboard:
             return 0
         
         # Compare first 2 vs last 2 sessions accuracy
-        first_sessions = self.session_data[:2]
-        last_sessions = self.session_data[-2:]
-        
-        def get_accuracy_from_sessions(sessions):
-            total_successful = 0
-            total_attempts = 0
-            for session in sessions:
-                if 'pinch_analytics' in session:
-                    pinch_data = session['pinch_analytics']
-                    total_successful += pinch_data.get('successful_pinches', 0)
-                    total_attempts += pinch_data.get('total_pinch_attempts', 0)
-            return (total_successful / max(1, total_attempts)) * 100
-        
-        first_accuracy = get_accuracy_from_sessions(first_sessions)
-        last_accuracy = get_accuracy_from_sessions(last_sessions)
+        successful = self.session_columns['successful']
+        attempts = self.session_columns['attempts']
+        first_accuracy = successful[:2].sum() / max(1, attempts[:2].sum()) * 100
+        last_accuracy = successful[-2:].sum() / max(1, attempts[-2:].sum()) * 100
         
         if first_accuracy > 0:
             improvement = ((last_accuracy - first_accuracy) / first_accuracy) * 100
@@ -656,38 +698,79 @@ class EnhancedRehabDashboard:
         
         return 0
     
+    def _get_figure(self, name: str, nrows: int, ncols: int, figsize: Tuple[int, int]):
+        """Return a cached figure and its axes, cleared for redrawing"""
+        if name not in self._figures:
+            self._figures[name] = plt.subplots(nrows, ncols, figsize=figsize)
+        
+        fig, axes = self._figures[name]
+        for ax in np.ravel(axes):
+            ax.clear()
+        return fig, axes
+    
+    def _chart_digest(self, filename: str, *inputs) -> str:
+        """Hash the inputs of a chart, or return None if its PNG was drawn from the same inputs"""
+        digest = hashlib.blake2b(str(CHART_DPI).encode(), digest_size=16)
+        for values in inputs:
+            digest.update(values.tobytes() if isinstance(values, np.ndarray) else repr(values).encode())
+        digest = digest.hexdigest()
+        
+        if self._load_chart_hashes().get(filename) == digest and os.path.exists(os.path.join(self.progress_directory, filename)):
+            return None
+        if self._stale_charts is not None:
+            self._stale_charts.append(filename)
+            return None
+        return digest
+    
+    def _load_chart_hashes(self) -> Dict[str, str]:
+        """Read the input hashes of previously saved charts on first use"""
+        if self._chart_hashes is None:
+            try:
+                with open(self._chart_hashes_path, 'r') as f:
+                    self._chart_hashes = json.load(f)
+            except (OSError, ValueError):
+                self._chart_hashes = {}
+        return self._chart_hashes
+    
+    def _record_chart_digest(self, filename: str, digest: str):
+        """Remember the input hash of a chart that was just saved"""
+        self._chart_hashes[filename] = digest
+        if self._chart_hashes_path is not None:
+            _write_json(self._chart_hashes_path, self._chart_hashes)
+    
+    def __getstate__(self):
+        """Pickle for chart workers without the cached figures, which they rebuild on demand"""
+        state = self.__dict__.copy()
+        state['_figures'] = {}
+        return state
+    
     def _create_progress_charts(self):
         """Create progress visualization charts using matplotlib"""
         # Prepare daily data for charts
-        dates = sorted(self.daily_analytics.keys())
-        daily_scores = []
-        daily_accuracy = []
-        daily_smoothness = []
+        dates = self.daily_dates
+        daily_scores = (self.daily_columns['total_score'] / np.maximum(1, self.daily_columns['sessions_count'])).tolist()
+        daily_accuracy = self.daily_columns['avg_pinch_success_rate'].tolist()
+        daily_smoothness = self.daily_columns['avg_movement_smoothness'].tolist()
         
-        for date in dates:
-            day_data = self.daily_analytics[date]
-            
-            # Average score for the day
-            total_score = day_data['total_score']
-            sessions = day_data['sessions_count']
-            avg_score = total_score / max(1, sessions)
-            daily_scores.append(avg_score)
-            
-            # Average accuracy
-            pinch_rates = day_data['pinch_success_rate']
-            avg_accuracy = np.mean(pinch_rates) if pinch_rates else 0
-            daily_accuracy.append(avg_accuracy)
-            
-            # Average smoothness
-            smoothness_scores = day_data['movement_smoothness']
-            avg_smoothness = np.mean(smoothness_scores) if smoothness_scores else 0
-            daily_smoothness.append(avg_smoothness)
+        # Save chart data as JSON for web dashboard
+        chart_data = {
+            'dates': dates,
+            'daily_scores': daily_scores,
+            'daily_accuracy': daily_accuracy,
+            'daily_smoothness': daily_smoothness
+        }
+        
+        _write_json(os.path.join(self.progress_directory, 'chart_data.json'), chart_data)
+        
+        digest = self._chart_digest('progress_trends.png', dates, daily_scores, daily_accuracy, daily_smoothness)
+        if digest is None:
+            return
         
         # Convert dates to datetime objects for plotting
-        date_objects = [datetime.strptime(date, "%Y-%m-%d") for date in dates]
+        date_objects = self.daily_date_values
         
-        # Create figure with subplots
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 10))
+        # Reuse the figure with subplots across dashboard generations
+        fig, (ax1, ax2, ax3) = self._get_figure('progress', 3, 1, figsize=(12, 10))
         fig.suptitle('Performance Trends Over Time', fontsize=16, fontweight='bold')
         
         # Scores chart
@@ -715,37 +798,33 @@ class EnhancedRehabDashboard:
             ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
             plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.progress_directory, 'progress_trends.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
-        
-        # Save chart data as JSON for web dashboard
-        chart_data = {
-            'dates': dates,
-            'daily_scores': daily_scores,
-            'daily_accuracy': daily_accuracy,
-            'daily_smoothness': daily_smoothness
-        }
-        
-        with open(os.path.join(self.progress_directory, 'chart_data.json'), 'w') as f:
-            json.dump(chart_data, f, indent=2)
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.progress_directory, 'progress_trends.png'), **CHART_SAVE_KWARGS)
+        self._record_chart_digest('progress_trends.png', digest)
     
     def _create_physical_metrics_gauges(self):
         """Create physical metrics visualization"""
         # Calculate physical metrics
-        avg_hand_detection = np.mean([np.mean(day['hand_detection_rate']) 
-                                    for day in self.daily_analytics.values() 
-                                    if day['hand_detection_rate']])
+        avg_hand_detection = self._rate_means['hand_detection_rate']
+        avg_smoothness = self._rate_means['movement_smoothness']
+        pinch_accuracy = self._calculate_overall_accuracy()
         
-        avg_smoothness = np.mean([np.mean(day['movement_smoothness']) 
-                                for day in self.daily_analytics.values() 
-                                if day['movement_smoothness']])
+        # Save metrics data
+        physical_data = {
+            'hand_detection_rate': avg_hand_detection,
+            'movement_smoothness': avg_smoothness,
+            'pinch_accuracy': pinch_accuracy,
+            'overall_performance': (avg_hand_detection + avg_smoothness + pinch_accuracy) / 3
+        }
         
-        pinch_accuracy = self._calculate_overall_accuracy()
+        _write_json(os.path.join(self.progress_directory, 'physical_metrics.json'), physical_data)
+        
+        digest = self._chart_digest('physical_metrics.png', physical_data)
+        if digest is None:
+            return
         
         # Create gauge-style chart
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._get_figure('physical', 2, 2, figsize=(12, 8))
         fig.suptitle('Physical & Motor Metrics', fontsize=16, fontweight='bold')
         
         metrics = [
@@ -757,20 +836,18 @@ class EnhancedRehabDashboard:
         
         axes = [ax1, ax2, ax3, ax4]
         
+        # Arc lengths of all gauges in one pass, in points of the shared unit circle
+        values = np.clip(np.nan_to_num([metric[1] for metric in metrics]), 0, 100)
+        arc_points = (values / 100 * self._gauge_circle.shape[1]).astype(int)
+        
         for i, (name, value, unit, color) in enumerate(metrics):
             ax = axes[i]
             
-            # Create circular progress bar
-            theta = np.linspace(0, 2*np.pi, 100)
-            radius = 1
-            
             # Background circle
-            ax.plot(radius * np.cos(theta), radius * np.sin(theta), color='lightgray', linewidth=10)
+            ax.plot(*self._gauge_circle, color='lightgray', linewidth=10)
             
-            # Progress arc
-            progress_theta = np.linspace(0, 2*np.pi * (value/100), int(value))
-            ax.plot(radius * np.cos(progress_theta), radius * np.sin(progress_theta), 
-                   color=color, linewidth=10)
+            # Progress arc, a prefix of the same unit circle
+            ax.plot(*self._gauge_circle[:, :arc_points[i]], color=color, linewidth=10)
             
             # Add text
             ax.text(0, 0, f'{value:.1f}{unit}', ha='center', va='center', 
@@ -782,35 +859,50 @@ class EnhancedRehabDashboard:
             ax.set_aspect('equal')
             ax.axis('off')
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.progress_directory, 'physical_metrics.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
-        
-        # Save metrics data
-        physical_data = {
-            'hand_detection_rate': avg_hand_detection,
-            'movement_smoothness': avg_smoothness,
-            'pinch_accuracy': pinch_accuracy,
-            'overall_performance': (avg_hand_detection + avg_smoothness + pinch_accuracy) / 3
-        }
-        
-        with open(os.path.join(self.progress_directory, 'physical_metrics.json'), 'w') as f:
-            json.dump(physical_data, f, indent=2)
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.progress_directory, 'physical_metrics.png'), **CHART_SAVE_KWARGS)
+        self._record_chart_digest('physical_metrics.png', digest)
     
     def _create_engagement_analysis(self):
         """Create engagement pattern analysis"""
         # Calculate engagement metrics
-        dates = sorted(self.daily_analytics.keys())
-        session_counts = [self.daily_analytics[date]['sessions_count'] for date in dates]
-        durations = [self.daily_analytics[date]['total_duration'] / 60 for date in dates]  # Convert to minutes
-        game_variety = [len(self.daily_analytics[date]['games_played']) for date in dates]
+        dates = self.daily_dates
+        session_counts = self.daily_columns['sessions_count']
+        durations = self.daily_columns['total_duration'] / 60  # Convert to minutes
+        game_variety = self.daily_columns['game_variety']
+        
+        # Weekly pattern analysis
+        weekdays = _weekdays(self.daily_date_values)
+        weekday_days = np.bincount(weekdays, minlength=7)
+        weekday_totals = np.bincount(weekdays, weights=session_counts, minlength=7)
+        
+        weekday_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+        avg_sessions_by_weekday = np.divide(weekday_totals, weekday_days, out=np.zeros(7), where=weekday_days > 0)
+        
+        # Save engagement data
+        engagement_data = {
+            'total_sessions': session_counts.sum().item(),
+            'avg_sessions_per_day': session_counts.mean().item(),
+            'avg_duration_minutes': durations.mean().item(),
+            'avg_games_per_day': game_variety.mean().item(),
+            'most_active_weekday': weekday_names[np.argmax(avg_sessions_by_weekday)],
+            'consistency_score': self._session_consistency
+        }
+        
+        _write_json(os.path.join(self.progress_directory, 'engagement_data.json'), engagement_data)
+        
+        if not self.daily_analytics:
+            return
+        
+        digest = self._chart_digest('engagement_analysis.png', dates, session_counts, durations, game_variety)
+        if digest is None:
+            return
         
         # Create engagement visualization
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._get_figure('engagement', 2, 2, figsize=(14, 10))
         fig.suptitle('Engagement & Motivation Analysis', fontsize=16, fontweight='bold')
         
-        date_objects = [datetime.strptime(date, "%Y-%m-%d") for date in dates]
+        date_objects = self.daily_date_values
         
         # Sessions per day
         ax1.bar(date_objects, session_counts, color='#3498db', alpha=0.7)
@@ -830,15 +922,7 @@ class EnhancedRehabDashboard:
         ax3.set_ylabel('Different Games Played')
         ax3.grid(True, alpha=0.3)
         
-        # Weekly pattern analysis
-        weekdays = [datetime.strptime(date, "%Y-%m-%d").weekday() for date in dates]
-        weekday_sessions = defaultdict(list)
-        for i, day in enumerate(weekdays):
-            weekday_sessions[day].append(session_counts[i])
-        
-        weekday_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        avg_sessions_by_weekday = [np.mean(weekday_sessions.get(i, [0])) for i in range(7)]
-        
+        # Weekly pattern chart
         ax4.bar(weekday_names, avg_sessions_by_weekday, color='#f39c12', alpha=0.7)
         ax4.set_title('Average Sessions by Day of Week')
         ax4.set_ylabel('Average Sessions')
@@ -849,23 +933,9 @@ class EnhancedRehabDashboard:
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
             plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.progress_directory, 'engagement_analysis.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
-        
-        # Save engagement data
-        engagement_data = {
-            'total_sessions': sum(session_counts),
-            'avg_sessions_per_day': np.mean(session_counts),
-            'avg_duration_minutes': np.mean(durations),
-            'avg_games_per_day': np.mean(game_variety),
-            'most_active_weekday': weekday_names[np.argmax(avg_sessions_by_weekday)],
-            'consistency_score': 100 - (np.std(session_counts) / np.mean(session_counts) * 100) if np.mean(session_counts) > 0 else 0
-        }
-        
-        with open(os.path.join(self.progress_directory, 'engagement_data.json'), 'w') as f:
-            json.dump(engagement_data, f, indent=2)
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.progress_directory, 'engagement_analysis.png'), **CHART_SAVE_KWARGS)
+        self._record_chart_digest('engagement_analysis.png', digest)
     
     def _create_achievements_display(self):
         """Create achievements and milestones display"""
@@ -877,8 +947,7 @@ class EnhancedRehabDashboard:
             'consecutive_days': self.achievements.get('consecutive_days', 0)
         }
         
-        with open(os.path.join(self.progress_directory, 'achievements.json'), 'w') as f:
-            json.dump(achievements_data, f, indent=2)
+        _write_json(os.path.join(self.progress_directory, 'achievements.json'), achievements_data)
     
     def _create_detailed_insights(self):
         """Create detailed insights and recommendations"""
@@ -895,37 +964,18 @@ class EnhancedRehabDashboard:
             'next_milestones': self._suggest_next_milestones()
         }
         
-        with open(os.path.join(self.progress_directory, 'detailed_insights.json'), 'w') as f:
-            json.dump(insights, f, indent=2)
+        _write_json(os.path.join(self.progress_directory, 'detailed_insights.json'), insights)
     
     def _calculate_consistency_rating(self) -> str:
         """Calculate consistency rating based on session patterns"""
         if len(self.daily_analytics) < 3:
             return "Building Routine"
         
-        session_counts = [day['sessions_count'] for day in self.daily_analytics.values()]
-        consistency = 100 - (np.std(session_counts) / np.mean(session_counts) * 100) if np.mean(session_counts) > 0 else 0
-        
-        if consistency > 80:
-            return "Highly Consistent"
-        elif consistency > 60:
-            return "Moderately Consistent"
-        else:
-            return "Variable Pattern"
+        return CONSISTENCY_LABELS[np.searchsorted(CONSISTENCY_THRESHOLDS, self._session_consistency)]
     
     def _calculate_engagement_level(self) -> str:
         """Calculate engagement level"""
-        total_sessions = len(self.session_data)
-        days_active = len(self.daily_analytics)
-        
-        if total_sessions > 20:
-            return "Highly Engaged"
-        elif total_sessions > 10:
-            return "Well Engaged"
-        elif total_sessions > 5:
-            return "Building Engagement"
-        else:
-            return "Getting Started"
+        return ENGAGEMENT_LABELS[np.searchsorted(ENGAGEMENT_THRESHOLDS, len(self.session_data))]
     
     def _identify_strengths(self) -> List[str]:
         """Identify user's strengths"""
@@ -941,7 +991,7 @@ class EnhancedRehabDashboard:
         if self.achievements.get('consecutive_days', 0) > 3:
             strengths.append("Consistent daily practice routine")
         
-        if len(set(session.get('game_name') for session in self.session_data)) > 3:
+        if len(self.game_counts) > 3:
             strengths.append("Good variety in exercise selection")
         
         return strengths
@@ -954,9 +1004,7 @@ class EnhancedRehabDashboard:
         if accuracy < 70:
             areas.append("Pinch control precision")
         
-        avg_smoothness = np.mean([np.mean(day['movement_smoothness']) 
-                                for day in self.daily_analytics.values() 
-                                if day['movement_smoothness']])
+        avg_smoothness = self._rate_means['movement_smoothness']
         
         if avg_smoothness < 60:
             areas.append("Movement smoothness and control")
@@ -1001,106 +1049,60 @@ class EnhancedRehabDashboard:
     
     def save_complete_report(self):
         """Save a comprehensive text report"""
-        report_content = f"""
-# 🏥 REHABILITATION GAMING PROGRESS REPORT
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## 📊 EXECUTIVE SUMMARY
-- **Total Sessions Completed:** {len(self.session_data)}
-- **Games Played:** {len(set(session.get('game_name') for session in self.session_data))}
-- **Overall Accuracy:** {self._calculate_overall_accuracy():.1f}%
-- **Current Streak:** {self.achievements.get('consecutive_days', 0)} days
-- **Improvement Trend:** {self._calculate_improvement_percentage():+.1f}%
-
-## 🎯 GAME PERFORMANCE METRICS
-
-### Score Progression Analysis
-"""
+        print("📊 Generating comprehensive progress report...")
         
-        # Add game-specific analysis
-        game_stats = defaultdict(list)
-        for session in self.session_data:
-            game_name = session.get('game_name')
-            if 'game_specific_metrics' in session:
-                score = session['game_specific_metrics'].get('score', 0)
-                game_stats[game_name].append(score)
+        # Every value the report templates quote, computed once
+        accuracy = self._calculate_overall_accuracy()
+        improvement = self._calculate_improvement_percentage()
+        avg_smoothness = self._rate_means['movement_smoothness']
+        total_sessions = len(self.session_data)
+        days_active = len(self.daily_analytics)
         
-        for game, scores in game_stats.items():
-            if scores:
-                avg_score = np.mean(scores)
-                best_score = max(scores)
-                trend = "📈 Improving" if len(scores) > 1 and scores[-1] > scores[0] else "📊 Stable"
-                
-                report_content += f"""
-**{game}:**
-- Average Score: {avg_score:.1f}
-- Best Score: {best_score}
-- Sessions Played: {len(scores)}
-- Trend: {trend}
-"""
+        context = {
+            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'total_sessions': total_sessions,
+            'games_played': len(self.game_counts),
+            'accuracy': accuracy,
+            'streak': self.achievements.get('consecutive_days', 0),
+            'improvement': improvement,
+            'smoothness': avg_smoothness,
+            'detection': self._rate_means['hand_detection_rate'],
+            'motor_control': 'Improving' if improvement > 0 else 'Stable',
+            'days_active': days_active,
+            'sessions_per_day': total_sessions / max(1, days_active),
+            'favorite_game': self.game_counts.most_common(1)[0][0] if self.game_counts else 'None',
+            'strength_area': "High accuracy pinch control" if accuracy > 80 else "Consistent engagement",
+            'improvement_area': "Focus on movement smoothness" if avg_smoothness < 70 else "Continue current routine",
+            'motor_skills': ('Excellent progress' if improvement > 10 else
+                             'Steady improvement' if improvement > 0 else 'Maintaining baseline'),
+            'engagement_level': ('Highly engaged' if total_sessions > 15 else
+                                 'Well engaged' if total_sessions > 8 else 'Building routine')
+        }
         
-        report_content += f"""
-
-## 💪 PHYSICAL/MOTOR IMPROVEMENT METRICS
-
-### Hand Movement Analysis
-- **Movement Smoothness:** {np.mean([np.mean(day['movement_smoothness']) for day in self.daily_analytics.values() if day['movement_smoothness']]):.1f}/100
-- **Hand Detection Rate:** {np.mean([np.mean(day['hand_detection_rate']) for day in self.daily_analytics.values() if day['hand_detection_rate']]):.1f}%
-- **Pinch Control Accuracy:** {self._calculate_overall_accuracy():.1f}%
-
-### Range of Motion Progress
-- **Tracking Quality:** Excellent (based on consistent hand detection)
-- **Fine Motor Control:** {'Improving' if self._calculate_improvement_percentage() > 0 else 'Stable'}
-
-## 🎮 ENGAGEMENT & MOTIVATION METRICS
-
-### Session Patterns
-- **Total Sessions:** {len(self.session_data)}
-- **Days Active:** {len(self.daily_analytics)}
-- **Average Sessions per Day:** {len(self.session_data) / max(1, len(self.daily_analytics)):.1f}
-- **Longest Streak:** {self.achievements.get('consecutive_days', 0)} consecutive days
-
-### Game Variety
-- **Games Explored:** {len(set(session.get('game_name') for session in self.session_data))}
-- **Favorite Game:** {max(set(session.get('game_name') for session in self.session_data), key=lambda x: sum(1 for s in self.session_data if s.get('game_name') == x))}
-
-## 🏆 ACHIEVEMENTS & MILESTONES
-
-### Earned Badges
-"""
+        parts = [REPORT_HEADER.format_map(context)]
         
-        for badge in self.achievements.get('badges', []):
-            report_content += f"- {badge}\n"
+        # Add game-specific analysis
+        for game, scores in self.game_scores.items():
+            if scores:
+                parts.append(REPORT_GAME_SECTION.format(
+                    game=game,
+                    avg_score=np.mean(scores),
+                    best_score=max(scores),
+                    sessions=len(scores),
+                    trend="📈 Improving" if len(scores) > 1 and scores[-1] > scores[0] else "📊 Stable"
+                ))
         
-        report_content += "\n### Milestones Reached\n"
-        for milestone in self.achievements.get('milestones', []):
-            report_content += f"- {milestone}\n"
+        parts.append(REPORT_METRICS.format_map(context))
+        parts.extend(f"- {badge}\n" for badge in self.achievements.get('badges', []))
         
-        report_content += f"""
-
-## 🔍 DETAILED INSIGHTS & RECOMMENDATIONS
-
-### Performance Analysis
-- **Strength Areas:** {"High accuracy pinch control" if self._calculate_overall_accuracy() > 80 else "Consistent engagement"}
-- **Improvement Areas:** {"Focus on movement smoothness" if np.mean([np.mean(day['movement_smoothness']) for day in self.daily_analytics.values() if day['movement_smoothness']]) < 70 else "Continue current routine"}
-
-### Rehabilitation Progress
-- **Motor Skills:** {'Excellent progress' if self._calculate_improvement_percentage() > 10 else 'Steady improvement' if self._calculate_improvement_percentage() > 0 else 'Maintaining baseline'}
-- **Engagement Level:** {'Highly engaged' if len(self.session_data) > 15 else 'Well engaged' if len(self.session_data) > 8 else 'Building routine'}
-
-### Next Steps Recommendations
-1. **Continue current routine** - showing positive trends
-2. **Increase session frequency** if possible for faster progress
-3. **Try variety of games** to work different motor skills
-4. **Set new challenges** as current performance is strong
-
----
-*This report was automatically generated by the Rehabilitation Gaming Analytics System*
-"""
+        parts.append("\n### Milestones Reached\n")
+        parts.extend(f"- {milestone}\n" for milestone in self.achievements.get('milestones', []))
+        
+        parts.append(REPORT_INSIGHTS.format_map(context))
         
         # Save report
         with open(os.path.join(self.progress_directory, 'detailed_progress_report.md'), 'w') as f:
-            f.write(report_content)
+            f.writelines(parts)
         
         print("✅ Comprehensive report saved!")
 
@@ -1109,22 +1111,21 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         if not self.session_data:
             return
         
-        # Count games using the correct data structure
-        game_counts = Counter([session.get('game_name', 'Unknown') 
-                              for session in self.session_data])
+        # Sessions per game, counted once by a bincount over the game codes
+        counts = self.game_session_counts
         
-        if not game_counts:
+        digest = self._chart_digest('game_distribution.png', self.game_names, counts)
+        if digest is None:
             return
         
         # Create pie chart
-        fig, ax = plt.subplots(figsize=(10, 8))
-        colors = plt.cm.Set3(np.linspace(0, 1, len(game_counts)))
+        fig, ax = self._get_figure('game_distribution', 1, 1, figsize=(10, 8))
         
-        wedges, texts, autotexts = ax.pie(game_counts.values(), 
-                                         labels=game_counts.keys(),
+        wedges, texts, autotexts = ax.pie(counts, 
+                                         labels=self.game_names,
                                          autopct='%1.1f%%',
-                                         colors=colors,
-                                         explode=[0.05] * len(game_counts))
+                                         colors=GAME_COLORS,
+                                         explode=[0.05] * len(counts))
         
         ax.set_title('Game Distribution - Sessions by Game Type', fontsize=16, fontweight='bold', pad=20)
         
@@ -1138,43 +1139,24 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             text.set_fontsize(12)
             text.set_fontweight('bold')
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.progress_directory, 'game_distribution.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.progress_directory, 'game_distribution.png'), **CHART_SAVE_KWARGS)
+        self._record_chart_digest('game_distribution.png', digest)
 
     def create_weekly_heatmap(self):
         """Create a weekly activity heatmap"""
         if not self.session_data:
             return
         
-        # Prepare data for heatmap using correct data structure
-        dates = []
-        for session in self.session_data:
-            timestamp = session.get('timestamp', '')
-            if timestamp:
-                try:
-                    date = datetime.fromisoformat(timestamp)
-                    dates.append(date)
-                except:
-                    continue
-        
-        if not dates:
-            return
-        
         # Count sessions per day and hour
-        activity_matrix = np.zeros((7, 24))  # 7 days x 24 hours
+        times = self.session_columns['time']
+        weekdays = _weekdays(times)
+        hours = times.astype('datetime64[h]').astype(np.int64) % 24
+        activity_matrix = np.bincount(weekdays * 24 + hours, minlength=7 * 24).reshape(7, 24)  # 7 days x 24 hours
         
-        for session in self.session_data:
-            timestamp = session.get('timestamp', '')
-            if timestamp:
-                try:
-                    dt = datetime.fromisoformat(timestamp)
-                    weekday = dt.weekday()
-                    hour = dt.hour
-                    activity_matrix[weekday, hour] += 1
-                except:
-                    continue
+        digest = self._chart_digest('weekly_heatmap.png', activity_matrix)
+        if digest is None:
+            return
         
         # Create heatmap
         fig, ax = plt.subplots(figsize=(14, 8))
@@ -1188,7 +1170,7 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         ax.set_yticklabels(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
         
         # Add colorbar
-        cbar = plt.colorbar(im, ax=ax)
+        cbar = fig.colorbar(im, ax=ax)
         cbar.set_label('Number of Sessions', rotation=270, labelpad=20)
         
         ax.set_title('Weekly Activity Heatmap - Sessions by Day and Hour', 
@@ -1196,51 +1178,40 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         ax.set_xlabel('Hour of Day')
         ax.set_ylabel('Day of Week')
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.progress_directory, 'weekly_heatmap.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.progress_directory, 'weekly_heatmap.png'), **CHART_SAVE_KWARGS, **FAST_PNG_KWARGS)
+        plt.close(fig)
+        self._record_chart_digest('weekly_heatmap.png', digest)
 
     def create_correlation_matrix(self):
         """Create a correlation matrix of performance metrics"""
-        if not self.daily_analytics:
+        # Correlations need at least two days to vary over
+        if len(self.daily_analytics) < 2:
             return
         
-        # Prepare data for correlation using correct data structure
+        # Per-day metric arrays, one value per active date
         metrics_data = {
-            'Smoothness': [],
-            'Success_Rate': [],
-            'Detection_Rate': [],
-            'Sessions': [],
-            'Duration': []
+            'Smoothness': self.daily_columns['avg_movement_smoothness'],
+            'Success_Rate': self.daily_columns['avg_pinch_success_rate'],
+            'Detection_Rate': self.daily_columns['avg_hand_detection_rate'],
+            'Sessions': self.daily_columns['sessions_count'],
+            'Duration': self.daily_columns['total_duration']
         }
         
-        for day_data in self.daily_analytics.values():
-            # Extract metrics from the actual data structure
-            smoothness_scores = day_data.get('movement_smoothness', [])
-            pinch_rates = day_data.get('pinch_success_rate', [])
-            detection_rates = day_data.get('hand_detection_rate', [])
-            
-            metrics_data['Smoothness'].append(np.mean(smoothness_scores) if smoothness_scores else 0)
-            metrics_data['Success_Rate'].append(np.mean(pinch_rates) if pinch_rates else 0)
-            metrics_data['Detection_Rate'].append(np.mean(detection_rates) if detection_rates else 0)
-            metrics_data['Sessions'].append(day_data.get('sessions_count', 0))
-            metrics_data['Duration'].append(day_data.get('total_duration', 0))
-        
         # Create correlation matrix manually (without pandas)
         metric_names = list(metrics_data.keys())
         n_metrics = len(metric_names)
         correlation_matrix = np.zeros((n_metrics, n_metrics))
         
-        for i, metric1 in enumerate(metric_names):
-            for j, metric2 in enumerate(metric_names):
-                data1 = np.array(metrics_data[metric1])
-                data2 = np.array(metrics_data[metric2])
-                
-                if np.std(data1) > 0 and np.std(data2) > 0:
-                    correlation_matrix[i, j] = np.corrcoef(data1, data2)[0, 1]
-                else:
-                    correlation_matrix[i, j] = 0
+        # One corrcoef over the metrics that vary; constant metrics keep a correlation of 0
+        stacked = np.vstack([np.asarray(values, dtype=np.float64) for values in metrics_data.values()])
+        varying = stacked.std(axis=1) > 0
+        if varying.any():
+            correlation_matrix[np.ix_(varying, varying)] = np.corrcoef(stacked[varying])
+        
+        digest = self._chart_digest('correlation_matrix.png', metric_names, correlation_matrix)
+        if digest is None:
+            return
         
         # Create heatmap
         fig, ax = plt.subplots(figsize=(10, 8))
@@ -1260,24 +1231,34 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                              ha="center", va="center", color="black", fontweight='bold')
         
         # Add colorbar
-        cbar = plt.colorbar(im, ax=ax)
+        cbar = fig.colorbar(im, ax=ax)
         cbar.set_label('Correlation Coefficient', rotation=270, labelpad=20)
         
         ax.set_title('Performance Metrics Correlation Matrix', 
                     fontsize=16, fontweight='bold', pad=20)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.progress_directory, 'correlation_matrix.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.progress_directory, 'correlation_matrix.png'), **CHART_SAVE_KWARGS, **FAST_PNG_KWARGS)
+        plt.close(fig)
+        self._record_chart_digest('correlation_matrix.png', digest)
 
     def create_kpi_dashboard(self):
         """Create a comprehensive KPI dashboard"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        if not self.session_data:
+            return
+        
+        performance_score = self._calculate_overall_accuracy()
+        dates = self.daily_dates
+        scores = [np.mean(self.daily_analytics[date].get('scores', [0])) for date in dates]
+        digest = self._chart_digest('kpi_dashboard.png', performance_score, dates, scores,
+                                    len(self.session_data), len(self.daily_analytics), self.achievements)
+        if digest is None:
+            return
+        
+        fig, ((ax1, ax2), (ax3, ax4)) = self._get_figure('kpi', 2, 2, figsize=(16, 12))
         fig.suptitle('Key Performance Indicators Dashboard', fontsize=18, fontweight='bold')
         
         # KPI 1: Overall Performance Gauge
-        performance_score = self._calculate_overall_accuracy()
         theta = np.linspace(0, np.pi, 100)
         
         ax1.plot(np.cos(theta), np.sin(theta), 'k-', linewidth=3)
@@ -1301,9 +1282,6 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         
         # KPI 2: Progress Trend
         if self.daily_analytics:
-            dates = sorted(self.daily_analytics.keys())
-            scores = [np.mean(self.daily_analytics[date].get('scores', [0])) for date in dates]
-            
             ax2.plot(range(len(dates)), scores, marker='o', linewidth=3, markersize=8, color='#2ecc71')
             ax2.fill_between(range(len(dates)), scores, alpha=0.3, color='#2ecc71')
             
@@ -1351,66 +1329,50 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         
         ax4.set_title('Achievement Distribution', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.progress_directory, 'kpi_dashboard.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.progress_directory, 'kpi_dashboard.png'), **CHART_SAVE_KWARGS, **FAST_PNG_KWARGS)
+        self._record_chart_digest('kpi_dashboard.png', digest)
 
     def create_success_rate_trends(self):
         """Create success rate trends by game type"""
         if not self.session_data:
             return
         
-        # Group data by game and date using correct data structure
-        game_data = defaultdict(lambda: defaultdict(list))
-        
-        for session in self.session_data:
-            game_name = session.get('game_name', 'Unknown')
-            date = session.get('date', '')
-            
-            if date and game_name != 'Unknown':
-                try:
-                    # Extract success rate from pinch analytics
-                    pinch_analytics = session.get('pinch_analytics', {})
-                    success_rate = pinch_analytics.get('pinch_success_rate', 0)
-                    
-                    # If no pinch success rate, try to calculate from game-specific metrics
-                    if success_rate == 0:
-                        game_metrics = session.get('game_specific_metrics', {})
-                        if 'target_angles_hit' in game_metrics and 'total_targets' in game_metrics:
-                            total = game_metrics.get('total_targets', 1)
-                            success_rate = (game_metrics.get('target_angles_hit', 0) / max(1, total)) * 100
-                        elif 'angle_accuracy' in game_metrics:
-                            success_rate = game_metrics.get('angle_accuracy', 0)
-                    
-                    game_data[game_name][date].append(success_rate)
-                except:
-                    continue
+        columns = self.session_columns
+        keep = (columns['game_name'] != 'Unknown') & (columns['date'] != '')
+        if not keep.any():
+            return
         
-        if not game_data:
+        # Mean success rate per (game, day) pair, ordered by game code and then by day
+        codes = columns['game_code'][keep]
+        days = columns['date'][keep].astype('datetime64[D]').astype(np.int64)
+        first_day = days.min()
+        span = days.max() - first_day + 1
+        pairs, pair_index = np.unique(codes * span + (days - first_day), return_inverse=True)
+        pair_rates = np.bincount(pair_index, weights=columns['success_rate'][keep]) / np.bincount(pair_index)
+        pair_dates = (pairs % span + first_day).astype('datetime64[D]')
+        game_codes, starts = np.unique(pairs // span, return_index=True)
+        game_names = [self.game_names[code] for code in game_codes.tolist()]
+        
+        digest = self._chart_digest('success_rate_trends.png', game_names, pair_dates, pair_rates, starts)
+        if digest is None:
             return
         
         # Create plot
-        fig, ax = plt.subplots(figsize=(14, 8))
-        
-        colors = plt.cm.Set1(np.linspace(0, 1, len(game_data)))
+        fig, ax = self._get_figure('success_rate_trends', 1, 1, figsize=(14, 8))
         
-        for i, (game_name, dates_data) in enumerate(game_data.items()):
-            sorted_dates = sorted(dates_data.keys())
-            avg_success_rates = [np.mean(dates_data[date]) for date in sorted_dates]
-            
-            # Convert date strings to datetime objects for plotting
-            date_objects = [datetime.strptime(date, '%Y-%m-%d') for date in sorted_dates]
-            
+        for i, (game_name, date_objects, avg_success_rates) in enumerate(zip(game_names, np.split(pair_dates, starts[1:]),
+                                                                             np.split(pair_rates, starts[1:]))):
+            color = TREND_COLORS[i % len(TREND_COLORS)]
             ax.plot(date_objects, avg_success_rates, marker='o', linewidth=3, 
-                   markersize=8, label=game_name, color=colors[i])
+                   markersize=8, label=game_name, color=color)
             
             # Add trend line
             if len(avg_success_rates) > 1:
-                x_numeric = np.arange(len(sorted_dates))
+                x_numeric = np.arange(len(date_objects))
                 z = np.polyfit(x_numeric, avg_success_rates, 1)
                 p = np.poly1d(z)
-                ax.plot(date_objects, p(x_numeric), "--", alpha=0.6, color=colors[i])
+                ax.plot(date_objects, p(x_numeric), "--", alpha=0.6, color=color)
         
         ax.set_title('Success Rate Trends by Game Type', fontsize=16, fontweight='bold')
         ax.set_ylabel('Success Rate (%)')
@@ -1422,13 +1384,15 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.progress_directory, 'success_rate_trends.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.progress_directory, 'success_rate_trends.png'), **CHART_SAVE_KWARGS)
+        self._record_chart_digest('success_rate_trends.png', digest)
 
     def create_performance_radar_chart(self):
         """Create a radar chart showing overall performance across different dimensions"""
+        if not self.session_data:
+            return
+        
         # Define performance dimensions
         dimensions = ['Accuracy', 'Consistency', 'Engagement', 'Improvement', 'Variety']
         
@@ -1437,14 +1401,17 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         consistency_score = self._calculate_consistency_score()
         engagement_score = min(100, (len(self.session_data) / 20) * 100)  # Scale to sessions
         improvement_score = max(0, min(100, self._calculate_improvement_percentage() * 10))
-        variety_score = min(100, (len(set(s.get('metadata', {}).get('game_name') for s in self.session_data)) / 5) * 100)
+        variety_score = min(100, (len(self.game_counts) / 5) * 100)
         
         values = [accuracy_score, consistency_score, engagement_score, improvement_score, variety_score]
         
+        digest = self._chart_digest('performance_radar.png', values)
+        if digest is None:
+            return
+        
         # Create radar chart
-        angles = [n / float(len(dimensions)) * 2 * np.pi for n in range(len(dimensions))]
-        angles += angles[:1]  # Close the circle
-        values += values[:1]   # Close the circle
+        angles = np.linspace(0, 2 * np.pi, len(dimensions) + 1)  # Last angle closes the circle
+        values = np.array(values + values[:1], dtype=float)  # Close the circle
         
         fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
         
@@ -1466,22 +1433,31 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         ax.set_title('Performance Radar Chart\nOverall Rehabilitation Progress', 
                     fontsize=16, fontweight='bold', pad=30)
         
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.progress_directory, 'performance_radar.png'), 
-                   dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(os.path.join(self.progress_directory, 'performance_radar.png'), **CHART_SAVE_KWARGS)
+        plt.close(fig)
+        self._record_chart_digest('performance_radar.png', digest)
 
     def _calculate_consistency_score(self) -> float:
         """Calculate consistency score based on session patterns"""
         if len(self.daily_analytics) < 3:
             return 50.0  # Default for insufficient data
         
-        session_counts = [day['sessions_count'] for day in self.daily_analytics.values()]
-        if not session_counts or np.mean(session_counts) == 0:
-            return 0.0
-        
-        consistency = 100 - (np.std(session_counts) / np.mean(session_counts) * 100)
-        return max(0, min(100, consistency))
+        return max(0, min(100, self._session_consistency))
+
+    def _stale_chart_methods(self):
+        """Run the chart methods up to their digest check only, returning those whose chart needs redrawing"""
+        stale = []
+        self._stale_charts = []
+        try:
+            for method_name in PARALLEL_CHARTS:
+                getattr(self, method_name)()
+                if self._stale_charts:
+                    stale.append(method_name)
+                    self._stale_charts.clear()
+        finally:
+            self._stale_charts = None
+        return stale
 
     def generate_all_visualizations(self):
         """Generate all visualizations including the new ones"""
@@ -1491,48 +1467,22 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         self._create_progress_charts()
         self._create_physical_metrics_gauges()
         
-        # New visualizations
-        self.create_game_distribution_plot()
-        self.create_weekly_heatmap()
-        self.create_correlation_matrix()
-        self.create_kpi_dashboard()
-        self.create_success_rate_trends()
-        self.create_performance_radar_chart()
+        # New visualizations; only the stale ones are drawn, in parallel worker processes
+        # when there is more than one of them and more than one core
+        stale = self._stale_chart_methods()
+        workers = min(len(stale), os.cpu_count() or 1)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for digests in executor.map(_render_chart, [self] * len(stale), stale):
+                    self._chart_hashes.update(digests)
+            _write_json(self._chart_hashes_path, self._chart_hashes)
+        else:
+            for method_name in stale:
+                getattr(self, method_name)()
         
         print("✅ All visualizations generated successfully!")
 
-    def save_complete_report(self):
-        """Generate and save a comprehensive progress report"""
-        
-        print("📊 Generating comprehensive progress report...")
-        
-        report_content = f"""# 🏥 REHABILITATION GAMING PROGRESS REPORT
-*Generated on {datetime.now().strftime("%B %d, %Y at %I:%M %p")}*
 
----
-
-## 📈 PERFORMANCE OVERVIEW
-
-### Overall Statistics
-- **Total Sessions Completed:** {len(self.session_data)}
-- **Overall Accuracy:** {self._calculate_overall_accuracy():.1f}%
-- **Performance Improvement:** {self._calculate_improvement_percentage():.1f}%
-- **Consistency Rating:** {self._calculate_consistency_rating()}
-
-### Session Patterns
-- **Total Sessions:** {len(self.session_data)}
-- **Days Active:** {len(self.daily_analytics)}
-- **Average Sessions per Day:** {len(self.session_data) / max(1, len(self.daily_analytics)):.1f}
-- **Longest Streak:** {self.achievements.get('consecutive_days', 0)} consecutive days
-
-### Game Variety
-- **Games Explored:** {len(set(session.get('metadata', {}).get('game_name') for session in self.session_data))}
-- **Favorite Game:** {max(set(session.get('metadata', {}).get('game_name') for session in self.session_data), key=lambda x: sum(1 for s in self.session_data if s.get('metadata', {}).get('game_name') == x)) if self.session_data else 'None'}
-
-## 🏆 ACHIEVEMENTS & MILESTONES
-
-### Earned Badges
-"""
 if __name__ == "__main__":
     # Initialize dashboard
     dashboard = EnhancedRehabDashboard()
@@ -4,76 +4,104 @@ import pygame
 import random
 import sys
 import os
+import numpy as np
 from rehab_gamification.games.base_game import BaseGame
 import cv2
 
 # --- Constants ---
 HAND_CURSOR_SIZE = 25 
-WHITE = (255, 255, 255)
-RED = (255, 0, 0)
-BLUE = (0, 0, 255)
-BLACK = (0, 0, 0)
-
-# --- Balloon Class ---
-class Balloon:
-    def __init__(self, screen_width, screen_height):
-        self.screen_width = screen_width
-        self.screen_height = screen_height
-        self.radius = random.randint(30, 50) 
-        self.x = random.randint(self.radius, self.screen_width - self.radius)
-        self.y = self.screen_height + self.radius 
-        self.speed = random.randint(2, 5)
-        self.rect = pygame.Rect(self.x - self.radius, self.y - self.radius, self.radius * 2, self.radius * 2)
-        self.color = (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
-
-    def move(self):
-        self.y -= self.speed
-        self.rect.center = (self.x, self.y)
-
-    def draw(self, screen):
-        pygame.draw.circle(screen, self.color, self.rect.center, self.radius)
-
-    def is_popped_by(self, pos):
-        return self.rect.collidepoint(pos)
+WHITE = pygame.Color(255, 255, 255)
+RED = pygame.Color(255, 0, 0)
+BLUE = pygame.Color(0, 0, 255)
+BLACK = pygame.Color(0, 0, 0)
+MAX_BALLOONS = 15
+POP_SOUND_COOLDOWN_MS = 40
+POP_SOUND_CHANNELS = 4
+SPAWN_CHANCE = 1 / 15  # Per-tick chance of a new balloon
+SPAWN_SCHEDULE_SIZE = 1024
 
 # --- BalloonPopGame Class ---
 class BalloonPopGame(BaseGame):
     def __init__(self, screen, hand_tracker, cap, calibration_data=None):
         super().__init__(screen, hand_tracker, cap, calibration_data)
-        self.balloons = []
         self.score = 0
+        
+        # Balloons as parallel arrays; the first balloon_count slots are live, in spawn order
+        self.balloon_x = np.zeros(MAX_BALLOONS, dtype=np.int32)
+        self.balloon_y = np.zeros(MAX_BALLOONS, dtype=np.int32)
+        self.balloon_radius = np.zeros(MAX_BALLOONS, dtype=np.int32)
+        self.balloon_speed = np.zeros(MAX_BALLOONS, dtype=np.int32)
+        self.balloon_count = 0
+        # Pre-rendered balloon surfaces, one per live slot; they carry each balloon's color
+        self.balloon_sprites = []
         self.font = pygame.font.Font(None, 50)
         self.game_over_font = pygame.font.Font(None, 75)
         
         # Tracking metrics
         self.max_speed = 0
         self.last_hand_pos = None
-        self.hand_speeds = []
+        self.hand_speed_total = 0.0
+        self.hand_speed_count = 0
         self.min_pinch_distance = float('inf')
         self.max_pinch_distance = 0
-        self.pinch_distances = []
+        self.pinch_distance_total = 0.0
+        self.pinch_distance_count = 0
         
         try:
             self.pop_sound = pygame.mixer.Sound('./rehab_gamification/assets/pop.wav')
         except pygame.error:
             print("Warning: 'pop.wav' not found. Sound will not play.")
             self.pop_sound = None
+        
+        # Pops take turns on a small pool of reserved channels, so quick pops still overlap
+        # while a burst can only occupy POP_SOUND_CHANNELS mixer channels.
+        # set_reserved keeps the pool out of Sound.play()'s automatic channel selection.
+        self.pop_channels = []
+        if self.pop_sound:
+            pygame.mixer.set_reserved(POP_SOUND_CHANNELS)
+            self.pop_channels = [pygame.mixer.Channel(i) for i in range(POP_SOUND_CHANNELS)]
+        self._next_pop_channel = 0
+        self._last_pop_ticks = 0
 
     def spawn_balloon(self):
-        if len(self.balloons) < 15:
-            self.balloons.append(Balloon(self.screen_width, self.screen_height))
+        if self.balloon_count < MAX_BALLOONS:
+            i = self.balloon_count
+            radius = random.randint(30, 50)
+            self.balloon_radius[i] = radius
+            self.balloon_x[i] = random.randint(radius, self.screen_width - radius)
+            self.balloon_y[i] = self.screen_height + radius
+            self.balloon_speed[i] = random.randint(2, 5)
+            color = pygame.Color(random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
+            sprite = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self.balloon_sprites.append(sprite)
+            self.balloon_count += 1
+
+    def _schedule_spawns(self, tick):
+        # Ticks of the next SPAWN_SCHEDULE_SIZE spawns; geometric gaps give the same odds as a per-tick coin flip
+        return (tick + np.cumsum(np.random.geometric(SPAWN_CHANCE, SPAWN_SCHEDULE_SIZE))).tolist()
+
+    def _keep_balloons(self, keep):
+        # Compact the live balloons down to those where keep is True, preserving their order
+        count = int(keep.sum())
+        for column in (self.balloon_x, self.balloon_y, self.balloon_radius, self.balloon_speed):
+            column[:count] = column[:self.balloon_count][keep]
+        self.balloon_sprites = [sprite for sprite, kept in zip(self.balloon_sprites, keep.tolist()) if kept]
+        self.balloon_count = count
 
     def run(self):
         cam_w = self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)
         cam_h = self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+        tick = 0
+        spawn_ticks = self._schedule_spawns(tick)
+        spawn_index = 0
 
         while not self.game_over:
-            success, frame = self.cap.read()
+            # Landmarks are refreshed from the capture thread every other tick and reused in between
+            success, lm_list, is_new = self.read_hand_landmarks(draw=True)
             if not success:
                 print("Failed to grab camera frame.")
                 continue
-            
-            processed_frame = self.display_camera_feed(frame, draw=True)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -82,70 +110,99 @@ class BalloonPopGame(BaseGame):
                     self.game_over = True
 
             # --- Game Logic ---
-            if random.randint(1, 15) == 1:
+            tick += 1
+            if tick >= spawn_ticks[spawn_index]:
                 self.spawn_balloon()
+                spawn_index += 1
+                if spawn_index == SPAWN_SCHEDULE_SIZE:
+                    spawn_ticks = self._schedule_spawns(tick)
+                    spawn_index = 0
 
-            lm_list = self.hand_tracker.get_landmark_positions(processed_frame, draw=False)
-            hand_pos = self.hand_tracker.get_hand_position(lm_list)
-            
-            # Calculate hand speed (keeping existing logic for compatibility)
-            if self.last_hand_pos and hand_pos != (0, 0):
-                speed = ((hand_pos[0] - self.last_hand_pos[0])**2 + (hand_pos[1] - self.last_hand_pos[1])**2)**0.5
-                self.hand_speeds.append(speed)
-                self.max_speed = max(self.max_speed, speed)
-            self.last_hand_pos = hand_pos
+            # Per-frame motion metrics only count freshly tracked frames
+            if is_new:
+                hand_pos = self.hand_tracker.get_hand_position(lm_list)
+                
+                # Calculate hand speed (keeping existing logic for compatibility)
+                if self.last_hand_pos and hand_pos != (0, 0):
+                    speed = ((hand_pos[0] - self.last_hand_pos[0])**2 + (hand_pos[1] - self.last_hand_pos[1])**2)**0.5
+                    self.hand_speed_total += speed
+                    self.hand_speed_count += 1
+                    if speed > self.max_speed:
+                        self.max_speed = speed
+                self.last_hand_pos = hand_pos
             
-            # Calculate pinch distance (keeping existing logic for compatibility)
+            # Pinch distance, gesture and position from a single pass over the thumb and index tips
+            is_pinching = False
+            pinch_pos = (0, 0)
             if len(lm_list) >= 9:
-                thumb_tip = lm_list[4]
-                index_tip = lm_list[8]
-                pinch_distance = self.hand_tracker.calculate_distance(thumb_tip, index_tip)
-                self.pinch_distances.append(pinch_distance)
-                self.min_pinch_distance = min(self.min_pinch_distance, pinch_distance)
-                self.max_pinch_distance = max(self.max_pinch_distance, pinch_distance)
-            
-            is_pinching, pinch_pos = self.hand_tracker.get_pinch_gesture(
-                lm_list, 
-                pinch_threshold=self.calibration_data.get("pinch_threshold", 40)
-            )
+                _, thumb_x, thumb_y = lm_list[4]
+                _, index_x, index_y = lm_list[8]
+                pinch_distance = ((index_x - thumb_x)**2 + (index_y - thumb_y)**2)**0.5
+                is_pinching = pinch_distance < self.calibration_data.get("pinch_threshold", 40)
+                pinch_pos = ((thumb_x + index_x) // 2, (thumb_y + index_y) // 2)
+                if is_new:
+                    self.pinch_distance_total += pinch_distance
+                    self.pinch_distance_count += 1
+                    if pinch_distance < self.min_pinch_distance:
+                        self.min_pinch_distance = pinch_distance
+                    if pinch_distance > self.max_pinch_distance:
+                        self.max_pinch_distance = pinch_distance
 
             if cam_w > 0 and cam_h > 0:
                 pinch_pos = (int(pinch_pos[0] * self.screen_width / cam_w), int(pinch_pos[1] * self.screen_height / cam_h))
 
-            # Check for balloon popping
+            # Move all balloons and drop the ones that floated off the top
+            n = self.balloon_count
+            xs, ys, radii = self.balloon_x[:n], self.balloon_y[:n], self.balloon_radius[:n]
+            np.subtract(ys, self.balloon_speed[:n], out=ys)
+            keep = ys >= -radii
+
+            # Check for balloon popping, within each balloon's bounding square.
+            # x - r <= px < x + r is one unsigned compare: px - x + r wraps around when negative.
             balloon_popped = False
-            for balloon in self.balloons[:]:
-                balloon.move()
-                if balloon.y < -balloon.radius:
-                    self.balloons.remove(balloon)
-                
-                if is_pinching:
-                    if balloon.is_popped_by(pinch_pos):
-                        self.balloons.remove(balloon)
-                        self.score += 1
-                        balloon_popped = True
-                        if self.pop_sound:
-                            self.pop_sound.play()
-                        break  # Only pop one balloon per pinch
+            if is_pinching:
+                px, py = pinch_pos
+                span = (2 * radii).view(np.uint32)
+                hits = (px - xs + radii).view(np.uint32) < span
+                hits &= (py - ys + radii).view(np.uint32) < span
+                hits &= keep
+                if hits.any():
+                    keep[hits.argmax()] = False  # Only pop one balloon per pinch
+                    self.score += 1
+                    balloon_popped = True
+                    if self.pop_channels:
+                        now = pygame.time.get_ticks()
+                        if now - self._last_pop_ticks > POP_SOUND_COOLDOWN_MS:
+                            # The channel whose turn it is started longest ago, so it is the one cut off when all are busy
+                            self.pop_channels[self._next_pop_channel].play(self.pop_sound)
+                            self._next_pop_channel = (self._next_pop_channel + 1) % POP_SOUND_CHANNELS
+                            self._last_pop_ticks = now
+
+            if not keep.all():
+                self._keep_balloons(keep)
             
             # Track pinch event with enhanced analytics
             if is_pinching:
                 self.track_pinch_event(lm_list, was_successful=balloon_popped, target_position=pinch_pos)
 
             # --- Drawing ---
-            for balloon in self.balloons:
-                balloon.draw(self.screen)
+            n = self.balloon_count
+            corners_x = (self.balloon_x[:n] - self.balloon_radius[:n]).tolist()
+            corners_y = (self.balloon_y[:n] - self.balloon_radius[:n]).tolist()
+            self._dirty_rects.extend(self.screen.blits(list(zip(self.balloon_sprites, zip(corners_x, corners_y)))))
 
             # Draw the pinch cursor on top of the skeleton
             if is_pinching:
-                pygame.draw.circle(self.screen, BLUE, pinch_pos, HAND_CURSOR_SIZE)
+                self.mark_dirty(pygame.draw.circle(self.screen, BLUE, pinch_pos, HAND_CURSOR_SIZE))
 
-            score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-            self.screen.blit(score_text, (10, 10))
+            score_text = self.render_text(self.font, f"Score: {self.score}", WHITE)
+            self.mark_dirty(self.screen.blit(score_text, (10, 10)))
 
-            pygame.display.flip()
+            # Only the overlays changed when the camera frame was reused
+            self.present_frame(full=is_new)
             self.clock.tick(60)
 
+        self.stop_capture()
         self.show_game_over_screen()
         return self.get_session_data()
 
@@ -178,8 +235,8 @@ class BalloonPopGame(BaseGame):
         enhanced_data = self.get_enhanced_session_data()
         
         # Add balloon-specific game metrics
-        avg_speed = sum(self.hand_speeds) / len(self.hand_speeds) if self.hand_speeds else 0
-        avg_pinch_distance = sum(self.pinch_distances) / len(self.pinch_distances) if self.pinch_distances else 0
+        avg_speed = self.hand_speed_total / self.hand_speed_count if self.hand_speed_count else 0
+        avg_pinch_distance = self.pinch_distance_total / self.pinch_distance_count if self.pinch_distance_count else 0
         
         # Combine with existing balloon pop specific data
         balloon_specific_data = {
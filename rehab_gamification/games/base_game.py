@@ -2,12 +2,115 @@
 
 import pygame
 import cv2
+import sys
 import time
 import math
+import threading
 import numpy as np
+from collections import deque
 # This import path might be different for you, adjust if necessary
 from rehab_gamification.hand_tracking.hand_tracker import HandTracker
 
+# Hand tracking runs on every HAND_TRACKING_STRIDE-th tick; webcams deliver ~30 FPS to the 60 FPS game loop
+HAND_TRACKING_STRIDE = 2
+
+# Camera frames are downscaled to this width before hand detection
+TRACKING_FRAME_WIDTH = 320
+
+# Number of recent hand positions kept for movement analysis
+HAND_POSITION_HISTORY = 1000
+
+# Number of recent movement and pinch samples kept for smoothness and consistency scores
+ANALYTICS_HISTORY = 5000
+
+def open_camera(index=0, width=640, height=480, fps=30):
+    """
+    Opens a webcam with a one-frame buffer and MJPG capture, which keeps frames fresh and USB traffic low.
+    :param index: The camera index.
+    :param width: The requested frame width.
+    :param height: The requested frame height.
+    :param fps: The requested frame rate.
+    :return: The opened cv2.VideoCapture.
+    """
+    if sys.platform.startswith("linux"):
+        cap = cv2.VideoCapture(index, cv2.CAP_V4L2)
+    elif sys.platform == "win32":
+        cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+    else:
+        cap = cv2.VideoCapture(index)
+    if not cap.isOpened():
+        # Fall back to OpenCV's default backend
+        cap = cv2.VideoCapture(index)
+
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_FPS, fps)
+
+    # Drivers may ignore any of these, so report what was actually negotiated
+    print(f"Camera opened: {int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x{int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))} "
+          f"@ {cap.get(cv2.CAP_PROP_FPS):.0f} FPS, buffer size {int(cap.get(cv2.CAP_PROP_BUFFERSIZE))}")
+    return cap
+
+class CameraGrabber:
+    """
+    Reads camera frames on a background thread, keeping only the newest one so readers never block on the camera.
+    """
+    def __init__(self, cap):
+        """
+        Initializes the CameraGrabber.
+        :param cap: The opened cv2.VideoCapture to read from.
+        """
+        self.cap = cap
+        self.lock = threading.Lock()
+        self.frame = None
+        self.first_frame = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _loop(self):
+        """
+        Reads camera frames until stopped, replacing any frame that has not been consumed yet.
+        """
+        while not self._stop.is_set():
+            success, frame = self.cap.read()
+            if not success:
+                time.sleep(0.01)
+                continue
+            with self.lock:
+                self.frame = frame
+            self.first_frame.set()
+
+    def start(self):
+        """
+        Starts the capture thread if it is not already running.
+        """
+        if self._thread is None:
+            # Ask the driver not to queue stale frames; when it refuses, the thread still drains them
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the capture thread so the camera can be read directly again.
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def read(self):
+        """
+        Takes the newest frame without blocking.
+        :return: The frame, or None if no new frame arrived since the last read.
+        """
+        with self.lock:
+            frame, self.frame = self.frame, None
+        return frame
+
 class BaseGame:
     """
     A base class for games to handle camera feed and hand tracking with enhanced data collection.
@@ -28,9 +131,8 @@ class BaseGame:
         self.hand_movement_data = {
             "total_movements": 0,
             "successful_interactions": 0,
-            "hand_positions": [],  # Store (x, y, timestamp) for movement analysis
-            "movement_distances": [],  # Distance between consecutive hand positions
-            "movement_speeds": [],  # Speed of hand movement
+            "movement_distances": deque(maxlen=ANALYTICS_HISTORY),  # Distance between consecutive hand positions
+            "movement_speeds": deque(maxlen=ANALYTICS_HISTORY),  # Speed of hand movement
             "hand_detected_frames": 0,
             "total_frames": 0,
             "tracking_lost_count": 0,
@@ -40,10 +142,10 @@ class BaseGame:
         self.pinch_data = {
             "total_pinch_attempts": 0,
             "successful_pinches": 0,
-            "pinch_distances": [],  # Distance between thumb and index finger during pinches
-            "pinch_durations": [],  # How long each pinch was held
-            "pinch_positions": [],  # Where pinches occurred
-            "pinch_timing": [],  # Time between consecutive pinches
+            "pinch_distances": deque(maxlen=ANALYTICS_HISTORY),  # Distance between thumb and index finger during pinches
+            "pinch_durations": deque(maxlen=ANALYTICS_HISTORY),  # How long each pinch was held
+            "pinch_positions": deque(maxlen=ANALYTICS_HISTORY),  # Where pinches occurred
+            "pinch_timing": deque(maxlen=ANALYTICS_HISTORY),  # Time between consecutive pinches
             "failed_pinches": 0,
             "pinch_accuracy": 0
         }
@@ -54,6 +156,39 @@ class BaseGame:
         self.current_pinch_start = None
         self.last_pinch_time = None
         self.was_hand_detected_last_frame = False
+        
+        # Whole-session running sums, since the sample deques above only keep the most recent values
+        self.movement_distance_total = 0.0
+        self.movement_speed_total = 0.0
+        self.pinch_distance_sum = 0.0
+        self.pinch_duration_total = 0.0
+        self.pinch_duration_count = 0
+        self.pinch_timing_total = 0.0
+        self.pinch_timing_count = 0
+        
+        # Last HAND_POSITION_HISTORY hand positions as a ring buffer; pixel coordinates fit exactly in int16
+        self.hand_position_xy = np.zeros((HAND_POSITION_HISTORY, 2), dtype=np.int16)
+        self.hand_position_times = np.zeros(HAND_POSITION_HISTORY)
+        self.hand_position_count = 0
+        
+        # Rendered text surfaces keyed by (font, text, color)
+        self._text_cache = {}
+        
+        # Last tracked camera frame, redrawn on the ticks between hand tracking updates
+        self._frame_index = 0
+        self._camera_surface = None
+        self._lm_list = []
+        
+        # Reused per-frame camera buffers, allocated on the first frame
+        self._camera_rgb = None
+        self._camera_frame_surface = None
+        
+        # Background camera capture; the grabber keeps only the newest frame
+        self.camera_grabber = CameraGrabber(self.cap)
+        
+        # Screen areas drawn over this frame and the previous one, for partial display updates
+        self._dirty_rects = []
+        self._last_dirty_rects = []
 
     def display_camera_feed(self, frame, draw=True): # <<< CHANGED: Added draw parameter
         """
@@ -66,36 +201,83 @@ class BaseGame:
         frame = cv2.flip(frame, 1)
         
         # Find hands and draw landmarks (now respects the 'draw' parameter)
-        frame_with_hands = self.hand_tracker.find_hands(frame, draw=draw) # <<< CHANGED
+        frame_with_hands = self.hand_tracker.find_hands(frame, draw=draw, max_width=TRACKING_FRAME_WIDTH) # <<< CHANGED
         
-        # Track hand data for analytics
-        self._track_hand_data(frame_with_hands)
+        # Track hand data for analytics, keeping the landmarks for read_hand_landmarks
+        self._lm_list = self.hand_tracker.get_landmark_positions(frame_with_hands, draw=False)
+        self._track_hand_data(self._lm_list)
+
+        h, w = frame_with_hands.shape[:2]
+        if self._camera_rgb is None or self._camera_rgb.shape[:2] != (h, w):
+            self._camera_rgb = np.empty((h, w, 3), dtype=np.uint8)
+            self._camera_frame_surface = pygame.Surface((w, h))
+            if (w, h) == (self.screen_width, self.screen_height):
+                self._camera_surface = self._camera_frame_surface
+            else:
+                self._camera_surface = pygame.Surface((self.screen_width, self.screen_height))
 
-        # Convert the BGR image to RGB.
-        frame_rgb = cv2.cvtColor(frame_with_hands, cv2.COLOR_BGR2RGB)
+        # Convert the BGR image to RGB into the reused buffer
+        cv2.cvtColor(frame_with_hands, cv2.COLOR_BGR2RGB, dst=self._camera_rgb)
 
-        # The transpose is necessary to swap the axes for pygame
-        frame_pygame = pygame.surfarray.make_surface(frame_rgb.transpose((1, 0, 2)))
+        # swapaxes is a view that gives pygame its (width, height) layout without a copy
+        pygame.surfarray.blit_array(self._camera_frame_surface, self._camera_rgb.swapaxes(0, 1))
         
-        # Scale the camera feed to fit the screen
-        frame_scaled = pygame.transform.scale(frame_pygame, (self.screen_width, self.screen_height))
+        # Scale the camera feed to fit the screen, unless it already matches
+        if self._camera_surface is not self._camera_frame_surface:
+            pygame.transform.scale(self._camera_frame_surface, (self.screen_width, self.screen_height), self._camera_surface)
 
-        self.screen.blit(frame_scaled, (0, 0))
+        self.screen.blit(self._camera_surface, (0, 0))
         
         # Return the original processed frame (not the pygame surface)
         # for landmark position calculation.
         return frame_with_hands
     
-    def _track_hand_data(self, frame):
+    def start_capture(self):
+        """
+        Starts the background camera capture thread if it is not already running.
+        """
+        self.camera_grabber.start()
+
+    def stop_capture(self):
+        """
+        Stops the background camera capture thread so the camera can be read directly again.
+        """
+        self.camera_grabber.stop()
+
+    def read_hand_landmarks(self, draw=True):
+        """
+        Tracks the newest captured camera frame every HAND_TRACKING_STRIDE ticks, redrawing the last one in between.
+        :param draw: Whether to draw the full hand skeleton.
+        :return: A tuple (success, lm_list, is_new); is_new is False when lm_list is reused from an earlier tick.
+        """
+        self.start_capture()
+        tick = self._frame_index
+        self._frame_index += 1
+        if self._camera_surface is None:
+            # Wait for the camera to deliver its first frame
+            self.camera_grabber.first_frame.wait(timeout=1.0)
+        
+        frame = None
+        if tick % HAND_TRACKING_STRIDE == 0 or self._camera_surface is None:
+            frame = self.camera_grabber.read()
+        
+        if frame is None:
+            if self._camera_surface is None:
+                return False, [], False
+            self.screen.blit(self._camera_surface, (0, 0))
+            return True, self._lm_list, False
+        
+        self.display_camera_feed(frame, draw=draw)
+        return True, self._lm_list, True
+    
+    def _track_hand_data(self, lm_list):
         """
         Internal method to track hand movement and detection data.
+        :param lm_list: The landmark positions found in the current frame.
         """
         current_time = time.time()
         self.hand_movement_data["total_frames"] += 1
         
-        # Get hand landmarks
-        lm_list = self.hand_tracker.get_landmark_positions(frame, draw=False)
-        
         if lm_list and len(lm_list) > 8:  # Hand detected
             self.hand_movement_data["hand_detected_frames"] += 1
             
@@ -114,14 +296,15 @@ class BaseGame:
                     speed = distance / time_diff
                     self.hand_movement_data["movement_distances"].append(distance)
                     self.hand_movement_data["movement_speeds"].append(speed)
+                    self.movement_distance_total += distance
+                    self.movement_speed_total += speed
                     self.hand_movement_data["total_movements"] += 1
             
-            # Store position with timestamp
-            self.hand_movement_data["hand_positions"].append((current_pos[0], current_pos[1], current_time))
-            
-            # Keep only last 1000 positions to avoid memory issues
-            if len(self.hand_movement_data["hand_positions"]) > 1000:
-                self.hand_movement_data["hand_positions"] = self.hand_movement_data["hand_positions"][-1000:]
+            # Store position with timestamp, overwriting the oldest once the history is full
+            slot = self.hand_position_count % HAND_POSITION_HISTORY
+            self.hand_position_xy[slot] = current_pos
+            self.hand_position_times[slot] = current_time
+            self.hand_position_count += 1
             
             self.last_hand_position = current_pos
             
@@ -159,6 +342,8 @@ class BaseGame:
                 if self.last_pinch_time is not None:
                     time_between_pinches = current_time - self.last_pinch_time
                     self.pinch_data["pinch_timing"].append(time_between_pinches)
+                    self.pinch_timing_total += time_between_pinches
+                    self.pinch_timing_count += 1
                 
                 # Store pinch position and distance
                 thumb_tip = lm_list[4]
@@ -166,6 +351,7 @@ class BaseGame:
                 pinch_distance = self.hand_tracker.calculate_distance(thumb_tip, index_tip)
                 
                 self.pinch_data["pinch_distances"].append(pinch_distance)
+                self.pinch_distance_sum += pinch_distance
                 self.pinch_data["pinch_positions"].append(pinch_pos)
                 
                 if was_successful:
@@ -179,6 +365,8 @@ class BaseGame:
                 # End of pinch - calculate duration
                 pinch_duration = current_time - self.current_pinch_start
                 self.pinch_data["pinch_durations"].append(pinch_duration)
+                self.pinch_duration_total += pinch_duration
+                self.pinch_duration_count += 1
                 self.last_pinch_time = current_time
                 self.current_pinch_start = None
     
@@ -191,7 +379,7 @@ class BaseGame:
             return 0
             
         speeds = self.hand_movement_data["movement_speeds"]
-        speed_changes = [abs(speeds[i+1] - speeds[i]) for i in range(len(speeds)-1)]
+        speed_changes = [abs(b - a) for a, b in zip(speeds, list(speeds)[1:])]
         
         if not speed_changes:
             return 0
@@ -223,9 +411,9 @@ class BaseGame:
         # Calculate movement metrics
         avg_movement_speed = 0
         total_movement_distance = 0
-        if self.hand_movement_data["movement_speeds"]:
-            avg_movement_speed = sum(self.hand_movement_data["movement_speeds"]) / len(self.hand_movement_data["movement_speeds"])
-            total_movement_distance = sum(self.hand_movement_data["movement_distances"])
+        if self.hand_movement_data["total_movements"] > 0:
+            avg_movement_speed = self.movement_speed_total / self.hand_movement_data["total_movements"]
+            total_movement_distance = self.movement_distance_total
         
         # Calculate pinch metrics
         pinch_success_rate = 0
@@ -237,14 +425,14 @@ class BaseGame:
             pinch_success_rate = (self.pinch_data["successful_pinches"] / 
                                 self.pinch_data["total_pinch_attempts"]) * 100
         
-        if self.pinch_data["pinch_distances"]:
-            avg_pinch_distance = sum(self.pinch_data["pinch_distances"]) / len(self.pinch_data["pinch_distances"])
+        if self.pinch_data["total_pinch_attempts"] > 0:
+            avg_pinch_distance = self.pinch_distance_sum / self.pinch_data["total_pinch_attempts"]
         
-        if self.pinch_data["pinch_durations"]:
-            avg_pinch_duration = sum(self.pinch_data["pinch_durations"]) / len(self.pinch_data["pinch_durations"])
+        if self.pinch_duration_count:
+            avg_pinch_duration = self.pinch_duration_total / self.pinch_duration_count
             
-        if self.pinch_data["pinch_timing"]:
-            avg_time_between_pinches = sum(self.pinch_data["pinch_timing"]) / len(self.pinch_data["pinch_timing"])
+        if self.pinch_timing_count:
+            avg_time_between_pinches = self.pinch_timing_total / self.pinch_timing_count
         
         # Calculate overall interaction effectiveness
         interaction_effectiveness = 0
@@ -299,6 +487,46 @@ class BaseGame:
         consistency = max(0, 100 - (std_dev / mean_distance * 100))
         return round(consistency, 2)
 
+    def mark_dirty(self, rect):
+        """
+        Records a screen area that was drawn over this frame.
+        :param rect: The pygame.Rect returned by a blit or draw call.
+        :return: The same rect.
+        """
+        self._dirty_rects.append(rect)
+        return rect
+
+    def present_frame(self, full=True):
+        """
+        Pushes the frame to the display; partial updates only upload this frame's and last frame's dirty areas.
+        :param full: Whether the whole screen changed, e.g. because a new camera frame was drawn.
+        """
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._last_dirty_rects + self._dirty_rects)
+        self._last_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+
+    def render_text(self, font, text, color):
+        """
+        Renders text through a cache, so labels that have not changed are not rasterized every frame.
+        :param font: The pygame font to render with.
+        :param text: The string to render.
+        :param color: The text color.
+        :return: The rendered surface.
+        """
+        # pygame.Color is unhashable, so key on its components
+        key = (font, text, tuple(color))
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Keep the cache bounded for labels like scores that keep changing
+            if len(self._text_cache) >= 128:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+
     def show_game_over_screen(self):
         """Displays a 'Game Over' screen and waits for input to exit."""
         darken_surface = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
@@ -319,9 +547,10 @@ class BaseGame:
 
         waiting = True
         was_pinching = True 
+        self.start_capture()
         while waiting:
-            success, frame = self.cap.read()
-            if success:
+            frame = self.camera_grabber.read()
+            if frame is not None:
                 frame = cv2.flip(frame, 1)
                 lm_list = self.hand_tracker.get_landmark_positions(self.hand_tracker.find_hands(frame, draw=False), draw=False)
                 is_pinching, _ = self.hand_tracker.get_pinch_gesture(lm_list)
@@ -337,6 +566,7 @@ class BaseGame:
                     waiting = False
             
             self.clock.tick(20)
+        self.stop_capture()
 
     def run(self):
         # This method should be implemented by child game classes
@@ -29,14 +29,21 @@ class HandTracker:
         self.mp_draw = mp.solutions.drawing_utils
         self.results = None
 
-    def find_hands(self, frame, draw=True):
+    def find_hands(self, frame, draw=True, max_width=None):
         """
         Finds hands in a BGR image.
         :param frame: The image to find hands in.
         :param draw: Whether to draw the hand landmarks and connections.
+        :param max_width: If set, wider images are downscaled to this width before detection.
         :return: The image with or without the drawings.
         """
-        img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Landmarks are normalized, so they map back onto the full-size frame unchanged
+        h, w = frame.shape[:2]
+        if max_width and w > max_width:
+            small = cv2.resize(frame, (max_width, h * max_width // w), interpolation=cv2.INTER_AREA)
+            img_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+        else:
+            img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         self.results = self.hands.process(img_rgb)
 
         if self.results.multi_hand_landmarks:
@@ -84,20 +91,12 @@ class HandTracker:
         :param p3: The third point [id, x, y].
         :return: The angle in degrees.
         """
-        x1, y1 = p1[1], p1[2]
-        x2, y2 = p2[1], p2[2]
-        x3, y3 = p3[1], p3[2]
+        # Vectors from the vertex to the other two points
+        ax, ay = p1[1] - p2[1], p1[2] - p2[2]
+        bx, by = p3[1] - p2[1], p3[2] - p2[2]
 
-        # Calculate the angle using atan2
-        angle = math.degrees(math.atan2(y3 - y2, x3 - x2) - math.atan2(y1 - y2, x1 - x2))
-        if angle < 0:
-            angle += 360
-        
-        # Ensure the angle is between 0 and 180
-        if angle > 180:
-            angle = 360 - angle
-            
-        return angle
+        # A single atan2 of |cross| and dot gives the unsigned angle, already between 0 and 180
+        return math.degrees(math.atan2(abs(ax * by - ay * bx), ax * bx + ay * by))
 
     def get_hand_position(self, lm_list):
         """